@@ -6,14 +6,15 @@ Supports both 2D and 3D simulations.
 """
 
 from .boid import Boid
-from .predator import Predator, HuntingStrategy
+from .predator import Predator, HuntingStrategy, boid_positions, non_edge_indices
 from .flock import Flock, SimulationParams
 from .flock_optimized import FlockOptimized
-from .obstacle import Obstacle, compute_obstacle_avoidance
+from .obstacle import Obstacle, compute_obstacle_avoidance, compute_obstacle_avoidance_batch
 from .metrics import (
     compute_avg_distance_to_predator,
     compute_min_distance_to_predator,
     compute_flock_cohesion,
+    compute_predator_metrics,
     MetricsCollector,
 )
 
@@ -36,14 +37,18 @@ __all__ = [
     "Boid",
     "Predator",
     "HuntingStrategy",
+    "boid_positions",
+    "non_edge_indices",
     "Flock",
     "FlockOptimized",
     "SimulationParams",
     "Obstacle",
     "compute_obstacle_avoidance",
+    "compute_obstacle_avoidance_batch",
     "compute_avg_distance_to_predator",
     "compute_min_distance_to_predator",
     "compute_flock_cohesion",
+    "compute_predator_metrics",
     "MetricsCollector",
     # 3D classes
     "Boid3D",
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Boid:
     """
     A single boid agent in the flocking simulation.
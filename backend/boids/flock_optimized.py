@@ -9,14 +9,21 @@ import numpy as np
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 from .boid import Boid
-from .predator import Predator
+from .predator import (
+    Predator,
+    HuntingStrategy,
+    TARGET_RESCAN_FRAMES,
+    boid_positions,
+    non_edge_indices,
+)
 from .flock import SimulationParams
-from .obstacle import Obstacle, compute_obstacle_avoidance
+from .obstacle import Obstacle, compute_obstacle_avoidance, compute_obstacle_avoidance_batch
 from .rules_optimized import (
     FlockState, 
     compute_all_rules_kdtree, 
     compute_all_rules_with_predator_kdtree,
-    compute_all_rules_with_multi_predator_kdtree
+    compute_all_rules_with_multi_predator_kdtree,
+    compute_all_rules_batch
 )
 
 
@@ -148,9 +155,10 @@ class FlockOptimized:
         
         Key difference from naive Flock:
         1. Rebuild spatial index once at start of frame
-        2. Use KDTree queries for neighbor finding
-        3. Compute all velocity adjustments first
-        4. Apply all updates at end (parallel semantics)
+        2. Gather boid state into position/velocity arrays once
+        3. Compute every boid's velocity adjustment as batched array ops
+           (parallel semantics)
+        4. Write the new state back to the Boid objects once
         5. Update predators if present (Tier 2 + Multiple Predators)
         6. Apply obstacle avoidance (Optional Enhancement)
         """
@@ -159,82 +167,147 @@ class FlockOptimized:
         # Rebuild spatial index with current positions
         self._flock_state.update()
         
-        # Get all predator positions for multi-predator avoidance
-        predator_positions: List[Tuple[float, float]] = [
-            (pred.x, pred.y) for pred in self.predators
-        ]
-        
-        # Compute all velocity adjustments first (parallel semantics)
-        adjustments = []
-        
-        for i, boid in enumerate(self.boids):
-            # Compute flocking rules using KDTree (including multi-predator avoidance)
-            rules_dv = compute_all_rules_with_multi_predator_kdtree(
-                boid_index=i,
-                flock_state=self._flock_state,
+        positions = self._flock_state.positions
+        if self.boids:
+            velocities = self._flock_state.velocities
+            
+            # Flocking rules (including multi-predator avoidance) for all boids
+            dv = compute_all_rules_batch(
+                self._flock_state,
                 visual_range=p.visual_range,
                 protected_range=p.protected_range,
                 cohesion_factor=p.cohesion_factor,
                 alignment_factor=p.alignment_factor,
                 separation_strength=p.separation_strength,
-                predator_positions=predator_positions,
+                predator_positions=[(pred.x, pred.y) for pred in self.predators],
                 predator_detection_range=p.predator_detection_range,
                 predator_avoidance_strength=p.predator_avoidance_strength
             )
+            dv += self._boundary_steering_batch(positions)
+            if self.obstacles:
+                dv += compute_obstacle_avoidance_batch(
+                    positions,
+                    self.obstacles,
+                    detection_range=50.0,
+                    avoidance_strength=0.5
+                )
             
-            # Compute boundary steering
-            boundary_dv = self.apply_boundary_steering(boid)
-            
-            # Compute obstacle avoidance
-            obstacle_dv = compute_obstacle_avoidance(
-                boid.x, boid.y,
-                self.obstacles,
-                detection_range=50.0,
-                avoidance_strength=0.5
-            )
-            
-            adjustments.append((
-                rules_dv[0] + boundary_dv[0] + obstacle_dv[0],
-                rules_dv[1] + boundary_dv[1] + obstacle_dv[1]
-            ))
-        
-        # Apply all adjustments
-        for i, boid in enumerate(self.boids):
-            boid.vx += adjustments[i][0]
-            boid.vy += adjustments[i][1]
-            
-            self.enforce_speed_limits(boid)
-            
-            boid.x += boid.vx
-            boid.y += boid.vy
+            velocities = velocities + dv
+            self._enforce_speed_limits_batch(velocities)
             
             # Hard position clamping as safety net
-            boid.x = max(0, min(p.width, boid.x))
-            boid.y = max(0, min(p.height, boid.y))
+            positions = positions + velocities
+            np.clip(positions, 0, (p.width, p.height), out=positions)
+            
+            state = np.hstack((positions, velocities)).tolist()
+            for boid, (x, y, vx, vy) in zip(self.boids, state):
+                boid.x = x
+                boid.y = y
+                boid.vx = vx
+                boid.vy = vy
+        
+        # Update all predators against the boids' new positions
+        self.update_predators(positions)
+    
+    def _boundary_steering_batch(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized apply_boundary_steering for an (N, 2) position array.
+        
+        Returns:
+            (N, 2) array of velocity adjustments
+        """
+        p = self.params
+        upper = np.array([p.width - p.margin, p.height - p.margin])
+        
+        # Progressive boundary steering: force increases with distance past margin
+        low = positions < p.margin
+        high = positions > upper
+        push = np.where(low, p.turn_factor * (1.0 + (p.margin - positions) / p.margin), 0.0)
+        pull = np.where(high, p.turn_factor * (1.0 + (positions - upper) / p.margin), 0.0)
+        return push - pull
+    
+    def _enforce_speed_limits_batch(self, velocities: np.ndarray) -> None:
+        """Vectorized enforce_speed_limits, clamping an (N, 2) array in place."""
+        p = self.params
+        speed = np.sqrt(np.einsum('ij,ij->i', velocities, velocities))
+        
+        stopped = speed == 0
+        fast = speed > p.max_speed
+        # elif in the scalar version: rows clamped to max_speed stay there
+        slow = (speed < p.min_speed) & ~stopped & ~fast
         
-        # Update all predators
-        self.update_predators()
+        velocities[fast] = velocities[fast] / speed[fast, None] * p.max_speed
+        velocities[slow] = velocities[slow] / speed[slow, None] * p.min_speed
+        
+        if stopped.any():
+            angle = np.random.uniform(0, 2 * np.pi, stopped.sum())
+            velocities[stopped] = p.min_speed * np.column_stack((np.cos(angle), np.sin(angle)))
     
-    def update_predators(self) -> None:
+    def _assign_targets(self, positions: np.ndarray) -> None:
+        """
+        Pick nearest targets for every Falcon due a rescan in one pass.
+        
+        Builds the (hunters, candidates) squared-distance matrix against
+        the non-edge boids and takes a row-wise argmin, so the per-predator
+        scan in update_velocity_toward_nearest is skipped this frame.
+        
+        Args:
+            positions: (N, 2) array of boid positions
+        """
+        if len(positions) == 0:
+            return
+        
+        hunters = [
+            pred for pred in self.predators
+            if pred.strategy == HuntingStrategy.NEAREST_HUNTER
+            and not pred.is_in_cooldown
+            and pred.needs_nearest_rescan(len(positions))
+        ]
+        if not hunters:
+            return
+        
+        candidates = non_edge_indices(positions, self.params.width, self.params.height)
+        hunter_xy = np.array([(pred.x, pred.y) for pred in hunters])
+        offsets = positions[candidates][None, :, :] - hunter_xy[:, None, :]
+        dist_sq = np.einsum('pij,pij->pi', offsets, offsets)
+        targets = candidates[np.argmin(dist_sq, axis=1)]
+        
+        for pred, target in zip(hunters, targets):
+            pred.target_boid_index = int(target)
+            pred.frames_until_rescan = TARGET_RESCAN_FRAMES
+    
+    def update_predators(self, positions: Optional[np.ndarray] = None) -> None:
         """
         Update all predators' states.
         
         Each predator uses its assigned hunting strategy.
         Uses same boundary handling and speed limits as boids.
         Also avoids obstacles.
+        
+        Args:
+            positions: Optional (N, 2) array of the boids' current
+                positions (update() passes the array it just integrated);
+                gathered from the boids if omitted
         """
         if not self.predators:
             return
         
         p = self.params
         
+        # Boid positions are fixed while predators move; gather them once
+        if positions is None:
+            positions = boid_positions(self.boids)
+        
+        self._assign_targets(positions)
+        
         for predator in self.predators:
             # Predator uses its strategy to hunt
             predator.update_velocity_by_strategy(
                 self.boids,
                 hunting_strength=p.predator_hunting_strength,
                 width=p.width,
-                height=p.height
+                height=p.height,
+                positions=positions
             )
             
             # Apply boundary steering
@@ -269,6 +342,17 @@ class FlockOptimized:
             predator.x = max(0, min(p.width, predator.x))
             predator.y = max(0, min(p.height, predator.y))
     
+    def update_n(self, steps: int) -> None:
+        """
+        Advance the simulation by several time steps.
+        
+        Args:
+            steps: Number of update() steps to run
+        """
+        update = self.update
+        for _ in range(steps):
+            update()
+    
     # =========================================================================
     # Obstacle Management Methods
     # =========================================================================
@@ -29,6 +29,16 @@ def compute_distance_to_predator(boid: Boid, predator: Predator) -> float:
     return np.sqrt(dx * dx + dy * dy)
 
 
+def _boid_positions(boids: List[Boid]) -> np.ndarray:
+    """Gather boid positions into an (N, 2) array."""
+    return np.array([(b.x, b.y) for b in boids])
+
+
+def _distances_to_predator(positions: np.ndarray, predator: Predator) -> np.ndarray:
+    """Vectorized Euclidean distance from each position to the predator."""
+    return np.hypot(positions[:, 0] - predator.x, positions[:, 1] - predator.y)
+
+
 def compute_avg_distance_to_predator(boids: List[Boid], predator: Predator) -> float:
     """
     Compute average distance from all boids to the predator.
@@ -43,8 +53,8 @@ def compute_avg_distance_to_predator(boids: List[Boid], predator: Predator) -> f
     if not boids:
         return 0.0
     
-    total_distance = sum(compute_distance_to_predator(b, predator) for b in boids)
-    return total_distance / len(boids)
+    distances = _distances_to_predator(_boid_positions(boids), predator)
+    return float(distances.mean())
 
 
 def compute_min_distance_to_predator(boids: List[Boid], predator: Predator) -> float:
@@ -64,7 +74,8 @@ def compute_min_distance_to_predator(boids: List[Boid], predator: Predator) -> f
     if not boids:
         return float('inf')
     
-    return min(compute_distance_to_predator(b, predator) for b in boids)
+    distances = _distances_to_predator(_boid_positions(boids), predator)
+    return float(distances.min())
 
 
 def compute_flock_center(boids: List[Boid]) -> Tuple[float, float]:
@@ -115,6 +126,38 @@ def compute_flock_cohesion(boids: List[Boid]) -> float:
     return (std_x + std_y) / 2
 
 
+def compute_predator_metrics(
+    boids: List[Boid],
+    predator: Predator
+) -> Tuple[float, float, float]:
+    """
+    Compute all per-frame predator metrics in a single pass.
+    
+    Equivalent to calling compute_avg_distance_to_predator,
+    compute_min_distance_to_predator and compute_flock_cohesion, but
+    gathers boid coordinates once and reuses them for all three.
+    
+    Args:
+        boids: List of all boids
+        predator: The predator
+        
+    Returns:
+        Tuple (avg_distance, min_distance, cohesion), or
+        (0.0, inf, 0.0) if no boids
+    """
+    if not boids:
+        return (0.0, float('inf'), 0.0)
+    
+    positions = _boid_positions(boids)
+    distances = _distances_to_predator(positions, predator)
+    
+    cohesion = 0.0
+    if len(boids) >= 2:
+        cohesion = float(positions.std(axis=0).mean())
+    
+    return (float(distances.mean()), float(distances.min()), cohesion)
+
+
 def compute_flock_spread(boids: List[Boid]) -> float:
     """
     Compute flock spread as the maximum distance between any two boids.
@@ -201,10 +244,11 @@ class MetricsCollector:
             # Skip frames where predator is disabled
             return
         
+        avg_distance, min_distance, cohesion = compute_predator_metrics(boids, predator)
         metrics = FrameMetrics(
-            avg_distance_to_predator=compute_avg_distance_to_predator(boids, predator),
-            min_distance_to_predator=compute_min_distance_to_predator(boids, predator),
-            flock_cohesion=compute_flock_cohesion(boids)
+            avg_distance_to_predator=avg_distance,
+            min_distance_to_predator=min_distance,
+            flock_cohesion=cohesion
         )
         
         self.frame_metrics.append(metrics)
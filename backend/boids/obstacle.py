@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from typing import List, Tuple
 import math
 
+import numpy as np
+
 
 @dataclass
 class Obstacle:
@@ -114,4 +116,46 @@ def compute_obstacle_avoidance(
         total_vx += vx
         total_vy += vy
     
-    return (total_vx * avoidance_strength, total_vy * avoidance_strength)
\ No newline at end of file
+    return (total_vx * avoidance_strength, total_vy * avoidance_strength)
+
+def compute_obstacle_avoidance_batch(
+    positions: np.ndarray,
+    obstacles: List[Obstacle],
+    detection_range: float = 50.0,
+    avoidance_strength: float = 0.5
+) -> np.ndarray:
+    """
+    Compute obstacle avoidance steering for all boids at once.
+    
+    Vectorized equivalent of calling compute_obstacle_avoidance per boid.
+    
+    Args:
+        positions: (N, 2) array of boid positions
+        obstacles: List of obstacles
+        detection_range: Distance at which avoidance starts
+        avoidance_strength: Multiplier for avoidance force
+        
+    Returns:
+        (N, 2) array of steering vectors
+    """
+    if not obstacles or len(positions) == 0:
+        return np.zeros((len(positions), 2))
+    
+    obs = np.array([(o.x, o.y, o.radius) for o in obstacles], dtype=float)
+    offsets = positions[:, None, :] - obs[None, :, :2]           # (N, M, 2)
+    center_dist = np.sqrt(np.einsum('nmk,nmk->nm', offsets, offsets))
+    surface_dist = center_dist - obs[None, :, 2]
+    
+    # Per-pair strength along the outward normal: 2.0 inside the obstacle,
+    # fading from 1.0 at the surface to 0.0 at detection_range outside it
+    inside = surface_dist <= 0
+    in_range = ~inside & (surface_dist <= detection_range) & (center_dist >= 0.001)
+    strength = np.where(inside, 2.0, np.where(in_range, 1.0 - surface_dist / detection_range, 0.0))
+    
+    # At the exact center the normal is undefined; push along +x
+    at_center = inside & (center_dist < 0.001)
+    safe_dist = np.where(center_dist < 0.001, 1.0, center_dist)
+    vectors = offsets / safe_dist[..., None] * strength[..., None]
+    vectors[at_center] = (1.0, 0.0)
+    
+    return vectors.sum(axis=1) * avoidance_strength
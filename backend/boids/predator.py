@@ -7,6 +7,7 @@ causing boids to scatter and avoid it.
 Supports multiple hunting strategies for differentiated behavior.
 """
 
+import math
 import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional, TYPE_CHECKING
@@ -53,8 +54,45 @@ CHASE_FAILURE_FRAMES = 90  # ~1.5 seconds at 60fps
 # Edge avoidance: prefer targets at least this far from edges
 EDGE_MARGIN = 100.0
 
+# Nearest-target rescan: Falcon re-picks its target every this many frames
+TARGET_RESCAN_FRAMES = 3
 
-@dataclass
+
+def boid_positions(boids: List["Boid"]) -> np.ndarray:
+    """
+    Gather boid positions into an (N, 2) array for the strategy scans.
+    
+    Args:
+        boids: List of boids
+        
+    Returns:
+        Array of shape (N, 2) with one [x, y] row per boid
+    """
+    return np.array([(b.x, b.y) for b in boids], dtype=float).reshape(-1, 2)
+
+
+def non_edge_indices(positions: np.ndarray, width: float, height: float) -> np.ndarray:
+    """
+    Indices of boids at least EDGE_MARGIN away from every edge.
+    
+    Args:
+        positions: (N, 2) array of boid positions
+        width, height: simulation bounds
+        
+    Returns:
+        Integer index array; all indices if every boid is near an edge
+    """
+    near_edge = (
+        (positions < EDGE_MARGIN)
+        | (positions > (width - EDGE_MARGIN, height - EDGE_MARGIN))
+    ).any(axis=1)
+    indices = np.flatnonzero(~near_edge)
+    if len(indices) == 0:
+        indices = np.arange(len(positions))
+    return indices
+
+
+@dataclass(slots=True)
 class Predator:
     """
     A predator agent that hunts boids.
@@ -74,6 +112,7 @@ class Predator:
         cooldown_frames: frames remaining in post-catch cooldown
         last_target_distance: distance to target last frame (for chase failure)
         frames_without_progress: frames where distance hasn't decreased
+        frames_until_rescan: frames before NEAREST_HUNTER re-picks its target
     """
     x: float
     y: float
@@ -89,6 +128,7 @@ class Predator:
     cooldown_frames: int = 0
     last_target_distance: float = float('inf')
     frames_without_progress: int = 0
+    frames_until_rescan: int = 0
     
     @classmethod
     def create_at_position(
@@ -237,8 +277,7 @@ class Predator:
         """
         dx = self.x - target_x
         dy = self.y - target_y
-        distance = np.sqrt(dx * dx + dy * dy)
-        return distance < CATCH_DISTANCE
+        return dx * dx + dy * dy < CATCH_DISTANCE * CATCH_DISTANCE
     
     def check_chase_failure(self, current_distance: float) -> bool:
         """
@@ -266,6 +305,22 @@ class Predator:
         """Check if target timeout has been reached."""
         return self.frames_since_target_switch >= MAX_TARGET_FRAMES
     
+    def needs_nearest_rescan(self, num_boids: int) -> bool:
+        """
+        Check if NEAREST_HUNTER should re-pick its target this frame.
+        
+        Args:
+            num_boids: current number of boids
+            
+        Returns:
+            True if there is no valid target or the rescan interval elapsed
+        """
+        return (
+            self.target_boid_index is None or
+            self.target_boid_index >= num_boids or
+            self.frames_until_rescan <= 0
+        )
+    
     def is_near_edge(self, x: float, y: float, width: float, height: float) -> bool:
         """
         Check if position is near simulation edge.
@@ -285,7 +340,8 @@ class Predator:
         boids: List["Boid"], 
         width: float, 
         height: float,
-        selector_func
+        selector_func,
+        positions: Optional[np.ndarray] = None
     ) -> Optional[int]:
         """
         Select a target boid, preferring those away from edges.
@@ -295,6 +351,10 @@ class Predator:
             width, height: simulation bounds
             selector_func: function(boids, excluded_indices) -> boid index
                           that selects a target from non-excluded boids
+            positions: Optional (N, 2) array of the boids' positions. If
+                given, the edge test is one vectorized mask and
+                selector_func receives an integer index array instead
+                of a list.
             
         Returns:
             Index of selected boid, or None if no valid targets
@@ -302,25 +362,33 @@ class Predator:
         if not boids:
             return None
         
+        if positions is not None:
+            return selector_func(boids, non_edge_indices(positions, width, height))
+        
         # First, try to find targets away from edges
-        non_edge_indices = [
+        candidates = [
             i for i, b in enumerate(boids)
             if not self.is_near_edge(b.x, b.y, width, height)
         ]
         
-        if non_edge_indices:
+        if candidates:
             # Select from non-edge boids
-            return selector_func(boids, non_edge_indices)
+            return selector_func(boids, candidates)
         else:
             # Fall back to any boid
             return selector_func(boids, list(range(len(boids))))
 
-    def compute_flock_center(self, boids: List["Boid"]) -> Optional[np.ndarray]:
+    def compute_flock_center(
+        self,
+        boids: List["Boid"],
+        positions: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
         """
         Compute center of mass of the flock.
         
         Args:
             boids: List of all boids
+            positions: Optional (N, 2) array of the boids' positions
             
         Returns:
             numpy array [x, y] of flock center, or None if no boids
@@ -328,18 +396,26 @@ class Predator:
         if not boids:
             return None
         
+        if positions is not None:
+            return positions.mean(axis=0)
+        
         sum_x = sum(b.x for b in boids)
         sum_y = sum(b.y for b in boids)
         n = len(boids)
         
         return np.array([sum_x / n, sum_y / n])
     
-    def compute_nearest_boid(self, boids: List["Boid"]) -> Optional["Boid"]:
+    def compute_nearest_boid(
+        self,
+        boids: List["Boid"],
+        positions: Optional[np.ndarray] = None
+    ) -> Optional["Boid"]:
         """
         Find the nearest boid to the predator.
         
         Args:
             boids: List of all boids
+            positions: Optional (N, 2) array of the boids' positions
             
         Returns:
             The nearest Boid, or None if no boids
@@ -347,26 +423,24 @@ class Predator:
         if not boids:
             return None
         
-        nearest = None
-        min_dist_sq = float('inf')
+        if positions is None:
+            positions = boid_positions(boids)
         
-        for boid in boids:
-            dx = self.x - boid.x
-            dy = self.y - boid.y
-            dist_sq = dx * dx + dy * dy
-            
-            if dist_sq < min_dist_sq:
-                min_dist_sq = dist_sq
-                nearest = boid
-        
-        return nearest
+        offsets = positions - (self.x, self.y)
+        dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+        return boids[int(np.argmin(dist_sq))]
     
-    def compute_straggler_boid(self, boids: List["Boid"]) -> Optional["Boid"]:
+    def compute_straggler_boid(
+        self,
+        boids: List["Boid"],
+        positions: Optional[np.ndarray] = None
+    ) -> Optional["Boid"]:
         """
         Find the most isolated boid (furthest from flock center).
         
         Args:
             boids: List of all boids
+            positions: Optional (N, 2) array of the boids' positions
             
         Returns:
             The most isolated Boid, or None if no boids
@@ -374,23 +448,12 @@ class Predator:
         if not boids:
             return None
         
-        center = self.compute_flock_center(boids)
-        if center is None:
-            return None
-        
-        straggler = None
-        max_dist_sq = -1
+        if positions is None:
+            positions = boid_positions(boids)
         
-        for boid in boids:
-            dx = boid.x - center[0]
-            dy = boid.y - center[1]
-            dist_sq = dx * dx + dy * dy
-            
-            if dist_sq > max_dist_sq:
-                max_dist_sq = dist_sq
-                straggler = boid
-        
-        return straggler
+        offsets = positions - self.compute_flock_center(boids, positions)
+        dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+        return boids[int(np.argmax(dist_sq))]
     
     def steer_toward(
         self,
@@ -418,9 +481,10 @@ class Predator:
         dvy = dy * hunting_strength
         
         # Clamp force magnitude to prevent overwhelming boundary steering
-        magnitude = np.sqrt(dvx * dvx + dvy * dvy)
-        if magnitude > max_force:
-            scale = max_force / magnitude
+        # (compare squared magnitudes; only take the root when clamping)
+        mag_sq = dvx * dvx + dvy * dvy
+        if mag_sq > max_force * max_force:
+            scale = max_force / math.sqrt(mag_sq)
             dvx *= scale
             dvy *= scale
         
@@ -429,7 +493,10 @@ class Predator:
     def update_velocity_toward_center(
         self,
         boids: List["Boid"],
-        hunting_strength: float = 0.05
+        hunting_strength: float = 0.05,
+        positions: Optional[np.ndarray] = None,
+        width: float = 800,
+        height: float = 600
     ) -> None:
         """
         Adjust velocity to move toward flock center of mass.
@@ -437,8 +504,11 @@ class Predator:
         Args:
             boids: List of all boids
             hunting_strength: multiplier for steering force
+            positions: Optional (N, 2) array of the boids' positions
+            width, height: unused; accepted so every strategy update
+                shares one call signature
         """
-        center = self.compute_flock_center(boids)
+        center = self.compute_flock_center(boids, positions)
         
         if center is None:
             return
@@ -452,7 +522,8 @@ class Predator:
         boids: List["Boid"],
         hunting_strength: float = 0.05,
         width: float = 800,
-        height: float = 600
+        height: float = 600,
+        positions: Optional[np.ndarray] = None
     ) -> None:
         """
         Adjust velocity to move toward nearest boid (Falcon strategy).
@@ -463,6 +534,9 @@ class Predator:
             boids: List of all boids
             hunting_strength: multiplier for steering force
             width, height: simulation bounds for edge avoidance
+            positions: Optional (N, 2) array of the boids' positions (e.g.
+                shared by a flock across its predators); gathered from
+                boids if omitted
         """
         if not boids:
             return
@@ -474,21 +548,26 @@ class Predator:
         
         self.frames_since_target_switch += 1
         
-        # Find nearest boid (with edge preference)
-        def select_nearest(boids_list, valid_indices):
-            nearest_idx = None
-            min_dist_sq = float('inf')
-            for i in valid_indices:
-                b = boids_list[i]
-                dx = self.x - b.x
-                dy = self.y - b.y
-                dist_sq = dx * dx + dy * dy
-                if dist_sq < min_dist_sq:
-                    min_dist_sq = dist_sq
-                    nearest_idx = i
-            return nearest_idx
-        
-        target_idx = self.select_target_avoiding_edges(boids, width, height, select_nearest)
+        # Find nearest boid (with edge preference). The scan is repeated
+        # only every TARGET_RESCAN_FRAMES frames; in between, the current
+        # target is chased at its latest position.
+        if self.needs_nearest_rescan(len(boids)):
+            if positions is None:
+                positions = boid_positions(boids)
+            
+            def select_nearest(boids_list, valid_indices):
+                idx = np.asarray(valid_indices)
+                offsets = positions[idx] - (self.x, self.y)
+                dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+                return int(idx[np.argmin(dist_sq)])
+            
+            self.target_boid_index = self.select_target_avoiding_edges(
+                boids, width, height, select_nearest, positions
+            )
+            self.frames_until_rescan = TARGET_RESCAN_FRAMES
+        
+        self.frames_until_rescan -= 1
+        target_idx = self.target_boid_index
         
         if target_idx is None:
             return
@@ -499,7 +578,7 @@ class Predator:
         # Calculate distance for catch/failure detection
         dx = self.x - target_boid.x
         dy = self.y - target_boid.y
-        distance = np.sqrt(dx * dx + dy * dy)
+        distance = math.sqrt(dx * dx + dy * dy)
         
         # Check for catch
         if self.check_catch(target_boid.x, target_boid.y):
@@ -529,7 +608,8 @@ class Predator:
         boids: List["Boid"],
         hunting_strength: float = 0.05,
         width: float = 800,
-        height: float = 600
+        height: float = 600,
+        positions: Optional[np.ndarray] = None
     ) -> None:
         """
         Adjust velocity to move toward most isolated boid (Eagle strategy).
@@ -540,6 +620,9 @@ class Predator:
             boids: List of all boids
             hunting_strength: multiplier for steering force
             width, height: simulation bounds for edge avoidance
+            positions: Optional (N, 2) array of the boids' positions (e.g.
+                shared by a flock across its predators); gathered from
+                boids if omitted
         """
         if not boids:
             return
@@ -551,23 +634,19 @@ class Predator:
         
         self.frames_since_target_switch += 1
         
+        if positions is None:
+            positions = boid_positions(boids)
+        
         # Find straggler (with edge preference)
-        center = self.compute_flock_center(boids)
+        center = self.compute_flock_center(boids, positions)
         if center is None:
             return
         
         def select_straggler(boids_list, valid_indices):
-            straggler_idx = None
-            max_dist_sq = -1
-            for i in valid_indices:
-                b = boids_list[i]
-                dx = b.x - center[0]
-                dy = b.y - center[1]
-                dist_sq = dx * dx + dy * dy
-                if dist_sq > max_dist_sq:
-                    max_dist_sq = dist_sq
-                    straggler_idx = i
-            return straggler_idx
+            idx = np.asarray(valid_indices)
+            offsets = positions[idx] - center
+            dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+            return int(idx[np.argmax(dist_sq)])
         
         # Check if we have an existing valid target
         need_new_target = (
@@ -578,7 +657,7 @@ class Predator:
         
         if need_new_target:
             self.target_boid_index = self.select_target_avoiding_edges(
-                boids, width, height, select_straggler
+                boids, width, height, select_straggler, positions
             )
             if self.target_boid_index is not None:
                 self.frames_since_target_switch = 0
@@ -594,7 +673,7 @@ class Predator:
         # Calculate distance
         dx = self.x - target_boid.x
         dy = self.y - target_boid.y
-        distance = np.sqrt(dx * dx + dy * dy)
+        distance = math.sqrt(dx * dx + dy * dy)
         
         # Check for catch
         if self.check_catch(target_boid.x, target_boid.y):
@@ -622,7 +701,8 @@ class Predator:
         patrol_speed: float = 0.03,
         attack_range: float = 100.0,
         width: float = 800,
-        height: float = 600
+        height: float = 600,
+        positions: Optional[np.ndarray] = None
     ) -> None:
         """
         Patrol in circles, attack if boids come close (Kite strategy).
@@ -636,6 +716,9 @@ class Predator:
             patrol_speed: angular velocity of patrol
             attack_range: distance at which to break patrol and attack
             width, height: simulation bounds for edge avoidance
+            positions: Optional (N, 2) array of the boids' positions (e.g.
+                shared by a flock across its predators); gathered from
+                boids if omitted
         """
         # Initialize patrol center if not set
         if self.patrol_center is None:
@@ -654,22 +737,21 @@ class Predator:
             self.vy += dvy
             return
         
+        if positions is None:
+            positions = boid_positions(boids)
+        
         # Find nearest boid within attack range (preferring non-edge targets)
         def select_nearest_in_range(boids_list, valid_indices):
-            nearest_idx = None
-            min_dist_sq = attack_range * attack_range
-            for i in valid_indices:
-                b = boids_list[i]
-                dx = self.x - b.x
-                dy = self.y - b.y
-                dist_sq = dx * dx + dy * dy
-                if dist_sq < min_dist_sq:
-                    min_dist_sq = dist_sq
-                    nearest_idx = i
-            return nearest_idx
+            idx = np.asarray(valid_indices)
+            offsets = positions[idx] - (self.x, self.y)
+            dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+            k = np.argmin(dist_sq)
+            if dist_sq[k] < attack_range * attack_range:
+                return int(idx[k])
+            return None
         
         attack_target_idx = self.select_target_avoiding_edges(
-            boids, width, height, select_nearest_in_range
+            boids, width, height, select_nearest_in_range, positions
         )
         
         if attack_target_idx is not None:
@@ -680,7 +762,7 @@ class Predator:
             # Calculate distance
             dx = self.x - target_boid.x
             dy = self.y - target_boid.y
-            distance = np.sqrt(dx * dx + dy * dy)
+            distance = math.sqrt(dx * dx + dy * dy)
             
             # Check for catch
             if self.check_catch(target_boid.x, target_boid.y):
@@ -723,7 +805,8 @@ class Predator:
         hunting_strength: float = 0.05,
         switch_interval: int = 120,
         width: float = 800,
-        height: float = 600
+        height: float = 600,
+        positions: Optional[np.ndarray] = None
     ) -> None:
         """
         Lock onto a random boid, periodically switch targets (Osprey strategy).
@@ -735,6 +818,8 @@ class Predator:
             hunting_strength: multiplier for steering force
             switch_interval: frames between forced target switches
             width, height: simulation bounds for edge avoidance
+            positions: Optional (N, 2) array of the boids' positions, used
+                for the edge test when picking a new target
         """
         if not boids:
             return
@@ -757,12 +842,12 @@ class Predator:
         if need_new_target:
             # Select random target with edge avoidance
             def select_random(boids_list, valid_indices):
-                if not valid_indices:
+                if len(valid_indices) == 0:
                     return None
                 return np.random.choice(valid_indices)
             
             self.target_boid_index = self.select_target_avoiding_edges(
-                boids, width, height, select_random
+                boids, width, height, select_random, positions
             )
             if self.target_boid_index is not None:
                 self.frames_since_target_switch = 0
@@ -779,7 +864,7 @@ class Predator:
         # Calculate distance
         dx = self.x - target_boid.x
         dy = self.y - target_boid.y
-        distance = np.sqrt(dx * dx + dy * dy)
+        distance = math.sqrt(dx * dx + dy * dy)
         
         # Check for catch
         if self.check_catch(target_boid.x, target_boid.y):
@@ -804,7 +889,8 @@ class Predator:
         boids: List["Boid"],
         hunting_strength: float = 0.05,
         width: float = 800,
-        height: float = 600
+        height: float = 600,
+        positions: Optional[np.ndarray] = None
     ) -> None:
         """
         Update velocity based on assigned hunting strategy.
@@ -813,20 +899,13 @@ class Predator:
             boids: List of all boids
             hunting_strength: multiplier for steering force
             width, height: simulation bounds for edge avoidance
+            positions: Optional (N, 2) array of the boids' positions (e.g.
+                shared by a flock across its predators); gathered from
+                boids if omitted
         """
-        if self.strategy == HuntingStrategy.CENTER_HUNTER:
-            self.update_velocity_toward_center(boids, hunting_strength)
-        elif self.strategy == HuntingStrategy.NEAREST_HUNTER:
-            self.update_velocity_toward_nearest(boids, hunting_strength, width, height)
-        elif self.strategy == HuntingStrategy.STRAGGLER_HUNTER:
-            self.update_velocity_toward_straggler(boids, hunting_strength, width, height)
-        elif self.strategy == HuntingStrategy.PATROL_HUNTER:
-            self.update_velocity_patrol(boids, hunting_strength, width=width, height=height)
-        elif self.strategy == HuntingStrategy.RANDOM_HUNTER:
-            self.update_velocity_random_target(boids, hunting_strength, width=width, height=height)
-        else:
-            # Default to center hunting
-            self.update_velocity_toward_center(boids, hunting_strength)
+        # Unknown strategies default to center hunting
+        update = _STRATEGY_UPDATES.get(self.strategy, Predator.update_velocity_toward_center)
+        update(self, boids, hunting_strength, width=width, height=height, positions=positions)
     
     def apply_boundary_steering(
         self,
@@ -900,4 +979,15 @@ class Predator:
     def update_position(self) -> None:
         """Update position based on current velocity."""
         self.x += self.vx
-        self.y += self.vy
\ No newline at end of file
+        self.y += self.vy
+
+
+# Strategy -> update method. Looked up on every call (not bound per
+# instance) so reassigning predator.strategy takes effect immediately.
+_STRATEGY_UPDATES = {
+    HuntingStrategy.CENTER_HUNTER: Predator.update_velocity_toward_center,
+    HuntingStrategy.NEAREST_HUNTER: Predator.update_velocity_toward_nearest,
+    HuntingStrategy.STRAGGLER_HUNTER: Predator.update_velocity_toward_straggler,
+    HuntingStrategy.PATROL_HUNTER: Predator.update_velocity_patrol,
+    HuntingStrategy.RANDOM_HUNTER: Predator.update_velocity_random_target,
+}
@@ -7,6 +7,7 @@ causing boids to scatter and avoid it.
 Supports multiple hunting strategies for differentiated behavior.
 """
 
+import math
 import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional, TYPE_CHECKING
@@ -236,8 +237,7 @@ class Predator3D:
         dx = self.x - target_x
         dy = self.y - target_y
         dz = self.z - target_z
-        distance = np.sqrt(dx*dx + dy*dy + dz*dz)
-        return distance < CATCH_DISTANCE
+        return dx*dx + dy*dy + dz*dz < CATCH_DISTANCE * CATCH_DISTANCE
     
     def check_chase_failure(self, current_distance: float) -> bool:
         """Check if chase is failing (no progress toward target)."""
@@ -350,10 +350,10 @@ class Predator3D:
         dvy = dy * hunting_strength
         dvz = dz * hunting_strength
         
-        # Clamp force magnitude
-        magnitude = np.sqrt(dvx*dvx + dvy*dvy + dvz*dvz)
-        if magnitude > max_force:
-            scale = max_force / magnitude
+        # Clamp force magnitude (squared compare, sqrt only when clamping)
+        mag_sq = dvx*dvx + dvy*dvy + dvz*dvz
+        if mag_sq > max_force * max_force:
+            scale = max_force / math.sqrt(mag_sq)
             dvx *= scale
             dvy *= scale
             dvz *= scale
@@ -10,6 +10,8 @@ Implements the core flocking behaviors in 3D space:
 - Obstacle avoidance: Avoid spherical obstacles
 """
 
+import math
+
 import numpy as np
 from typing import List, Tuple, TYPE_CHECKING
 
@@ -367,15 +369,19 @@ def compute_obstacle_avoidance_3d(
     dvx, dvy, dvz = 0.0, 0.0, 0.0
     
     for obs in obstacles:
+        # Effective range includes obstacle radius
+        effective_range = detection_range + obs.radius
+        
         dx = x - obs.x
         dy = y - obs.y
         dz = z - obs.z
-        dist = np.sqrt(dx*dx + dy*dy + dz*dz)
-        
-        # Effective range includes obstacle radius
-        effective_range = detection_range + obs.radius
+        # Cheap per-axis rejection, then squared distance; sqrt only when in range
+        if abs(dx) >= effective_range or abs(dy) >= effective_range or abs(dz) >= effective_range:
+            continue
+        dist_sq = dx*dx + dy*dy + dz*dz
         
-        if dist < effective_range and dist > 0:
+        if dist_sq < effective_range * effective_range and dist_sq > 0:
+            dist = math.sqrt(dist_sq)
             # Strength increases as we get closer to obstacle surface
             # Maximum at obstacle surface, zero at effective_range
             surface_dist = dist - obs.radius
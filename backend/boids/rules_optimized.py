@@ -8,15 +8,21 @@ of O(n²) naive iteration.
 
 import numpy as np
 from scipy.spatial import KDTree
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from .boid import Boid
 
 
+# Larger leaves mean fewer nodes to build per frame; queries scan leaves in C
+KDTREE_LEAFSIZE = 32
+
+
 class FlockState:
     """
     Maintains spatial index for efficient neighbor queries.
     
-    Rebuilds KDTree each frame from current boid positions.
+    Rebuilds KDTree each frame from current boid positions. Neighbor
+    lists are computed for every boid in one batched query per radius
+    and cached until the next rebuild.
     """
     
     def __init__(self, boids: List[Boid]):
@@ -30,10 +36,14 @@ class FlockState:
         self._positions: Optional[np.ndarray] = None
         self._velocities: Optional[np.ndarray] = None
         self._tree: Optional[KDTree] = None
+        self._neighbor_cache: Dict[float, np.ndarray] = {}
+        self._pair_cache: Dict[float, np.ndarray] = {}
         self._rebuild()
     
     def _rebuild(self) -> None:
         """Rebuild spatial index from current boid positions."""
+        self._neighbor_cache.clear()
+        self._pair_cache.clear()
         if len(self.boids) == 0:
             self._positions = np.empty((0, 2))
             self._velocities = np.empty((0, 2))
@@ -42,7 +52,13 @@ class FlockState:
         
         self._positions = np.array([[b.x, b.y] for b in self.boids])
         self._velocities = np.array([[b.vx, b.vy] for b in self.boids])
-        self._tree = KDTree(self._positions)
+        # Rebuilt every frame: cheaper construction beats a perfectly balanced tree
+        self._tree = KDTree(
+            self._positions,
+            leafsize=KDTREE_LEAFSIZE,
+            balanced_tree=False,
+            compact_nodes=False,
+        )
     
     def update(self) -> None:
         """Call after boid positions change to rebuild spatial index."""
@@ -62,11 +78,33 @@ class FlockState:
         if self._tree is None:
             return []
         
-        position = self._positions[index]
-        neighbor_indices = self._tree.query_ball_point(position, radius)
+        neighbor_lists = self._neighbor_cache.get(radius)
+        if neighbor_lists is None:
+            # One C-level query for all boids instead of one per boid
+            neighbor_lists = self._tree.query_ball_point(self._positions, radius)
+            self._neighbor_cache[radius] = neighbor_lists
         
         # Remove self from results
-        return [i for i in neighbor_indices if i != index]
+        return [i for i in neighbor_lists[index] if i != index]
+    
+    def query_pairs(self, radius: float) -> np.ndarray:
+        """
+        Find all neighbor pairs within radius of each other.
+        
+        Args:
+            radius: Search radius
+            
+        Returns:
+            (M, 2) integer array of index pairs (i, j) with i < j
+        """
+        if self._tree is None:
+            return np.empty((0, 2), dtype=np.intp)
+        
+        pairs = self._pair_cache.get(radius)
+        if pairs is None:
+            pairs = self._tree.query_pairs(radius, output_type='ndarray')
+            self._pair_cache[radius] = pairs
+        return pairs
     
     @property
     def positions(self) -> np.ndarray:
@@ -528,4 +566,118 @@ def compute_all_rules_with_multi_predator_kdtree(
         dvx += pred_dvx
         dvy += pred_dvy
     
-    return (dvx, dvy)
\ No newline at end of file
+    return (dvx, dvy)
+
+def compute_all_rules_batch(
+    flock_state: FlockState,
+    visual_range: float,
+    protected_range: float,
+    cohesion_factor: float,
+    alignment_factor: float,
+    separation_strength: float,
+    predator_positions: List[Tuple[float, float]],
+    predator_detection_range: float,
+    predator_avoidance_strength: float
+) -> np.ndarray:
+    """
+    Compute all flocking rules with multi-predator avoidance for every boid.
+    
+    Vectorized equivalent of calling compute_all_rules_with_multi_predator_kdtree
+    for each boid index: neighbor pairs come from one KDTree query and the
+    per-boid sums are bincount reductions over those pairs.
+    
+    Args:
+        flock_state: FlockState with spatial index
+        visual_range: Distance threshold for visibility
+        protected_range: Distance threshold for separation
+        cohesion_factor: Weight for cohesion
+        alignment_factor: Weight for alignment
+        separation_strength: Weight for separation
+        predator_positions: List of (x, y) positions for all predators
+        predator_detection_range: Distance for predator detection
+        predator_avoidance_strength: Weight for predator avoidance
+        
+    Returns:
+        (N, 2) array of combined velocity adjustments
+    """
+    positions = flock_state.positions
+    velocities = flock_state.velocities
+    n = len(positions)
+    dv = np.zeros((n, 2))
+    if n == 0:
+        return dv
+    
+    pairs = flock_state.query_pairs(max(visual_range, protected_range))
+    if len(pairs):
+        i, j = pairs[:, 0], pairs[:, 1]
+        offsets = positions[i] - positions[j]
+        dist_sq = np.einsum('ij,ij->i', offsets, offsets)
+        protected = dist_sq <= protected_range * protected_range
+        flocking = (dist_sq <= visual_range * visual_range) & ~protected
+        
+        # Separation: each protected pair pushes both boids apart
+        si, sj, sep = i[protected], j[protected], offsets[protected]
+        fi, fj = i[flocking], j[flocking]
+        counts = np.bincount(fi, minlength=n) + np.bincount(fj, minlength=n)
+        has_flock = counts > 0
+        
+        for axis in range(2):
+            dv[:, axis] += (
+                np.bincount(si, sep[:, axis], n) - np.bincount(sj, sep[:, axis], n)
+            ) * separation_strength
+            
+            # Cohesion and alignment toward flocking-neighbor averages
+            if fi.size:
+                pos = positions[:, axis]
+                vel = velocities[:, axis]
+                sum_pos = np.bincount(fi, pos[fj], n) + np.bincount(fj, pos[fi], n)
+                sum_vel = np.bincount(fi, vel[fj], n) + np.bincount(fj, vel[fi], n)
+                c = counts[has_flock]
+                dv[has_flock, axis] += (sum_pos[has_flock] / c - pos[has_flock]) * cohesion_factor
+                dv[has_flock, axis] += (sum_vel[has_flock] / c - vel[has_flock]) * alignment_factor
+    
+    if predator_positions:
+        dv += _multi_predator_avoidance_batch(
+            positions, predator_positions,
+            predator_detection_range, predator_avoidance_strength
+        )
+    
+    return dv
+
+
+def _multi_predator_avoidance_batch(
+    positions: np.ndarray,
+    predator_positions: List[Tuple[float, float]],
+    detection_range: float,
+    avoidance_strength: float
+) -> np.ndarray:
+    """Vectorized compute_multi_predator_avoidance_kdtree over all boids."""
+    n = len(positions)
+    preds = np.asarray(predator_positions, dtype=float).reshape(-1, 2)
+    offsets = positions[:, None, :] - preds[None, :, :]            # (N, P, 2)
+    dist_sq = np.einsum('npk,npk->np', offsets, offsets)
+    
+    # Flee from the nearest predator only
+    rows = np.arange(n)
+    nearest = np.argmin(dist_sq, axis=1)
+    nearest_sq = dist_sq[rows, nearest]
+    nearest_offset = offsets[rows, nearest]
+    
+    dv = np.zeros((n, 2))
+    fleeing = nearest_sq < detection_range * detection_range
+    coincident = fleeing & (nearest_sq < 1e-10)
+    scaled = fleeing & ~coincident
+    
+    distance = np.sqrt(nearest_sq[scaled])
+    scale = (detection_range - distance) / detection_range
+    dv[scaled] = (
+        nearest_offset[scaled] / distance[:, None]
+        * (avoidance_strength * scale * detection_range)[:, None]
+    )
+    
+    # Predator at exact same position: flee in a random direction
+    if coincident.any():
+        angle = np.random.uniform(0, 2 * np.pi, coincident.sum())
+        dv[coincident] = avoidance_strength * 10 * np.column_stack((np.cos(angle), np.sin(angle)))
+    
+    return dv
@@ -17,6 +17,7 @@ SIMULATION_WIDTH: int = 800
 SIMULATION_HEIGHT: int = 600
 SIMULATION_DEPTH: int = 600  # Z-axis bounds for 3D mode
 TARGET_FPS: int = 60
+STEPS_PER_FRAME: int = 1  # Physics steps advanced per frame sent to the client
 
 
 # =============================================================================
@@ -281,7 +282,8 @@ class PresetName:
     SWARM_DEFENSE = "swarm_defense"
 
 
-VALID_PRESETS = [
+# frozenset: membership is checked on every preset message
+VALID_PRESETS = frozenset({
     PresetName.DEFAULT,
     PresetName.TIGHT_SWARM,
     PresetName.LOOSE_CLOUD,
@@ -289,4 +291,4 @@ VALID_PRESETS = [
     PresetName.SLOW_DANCE,
     PresetName.PREDATOR_CHASE,
     PresetName.SWARM_DEFENSE,
-]
\ No newline at end of file
+})
\ No newline at end of file
@@ -11,7 +11,7 @@ from typing import Dict
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
-from config import TARGET_FPS, MessageType
+from config import TARGET_FPS, STEPS_PER_FRAME, MessageType
 from models import (
     parse_client_message,
     UpdateParamsMessage,
@@ -86,9 +86,14 @@ class ConnectionManager:
         self.active_connections: Dict[WebSocket, SimulationManager] = {}
 
     async def connect(self, websocket: WebSocket) -> SimulationManager:
-        """Accept connection and create simulation."""
+        """Accept connection and create simulation.
+
+        Clients connecting with ``?boids=f32`` receive frame boids as a
+        base64 string of packed float32 rows instead of nested lists.
+        """
         await websocket.accept()
-        manager = SimulationManager()
+        pack_boids = websocket.query_params.get("boids") == "f32"
+        manager = SimulationManager(pack_boids=pack_boids)
         manager.start()
         self.active_connections[websocket] = manager
         return manager
@@ -234,9 +239,11 @@ async def websocket_endpoint(websocket: WebSocket):
         try:
             while running:
                 frame_start = asyncio.get_event_loop().time()
-                manager.update()
+                manager.update_n(STEPS_PER_FRAME)
                 frame_data = manager.get_frame_data()
-                await websocket.send_json(frame_data.model_dump())
+                # pydantic's native JSON encoder: same payload as send_json,
+                # without building an intermediate dict for json.dumps
+                await websocket.send_text(frame_data.model_dump_json())
                 
                 frame_end = asyncio.get_event_loop().time()
                 elapsed = frame_end - frame_start
@@ -5,8 +5,16 @@ Provides validation for simulation parameters, WebSocket messages,
 and frame data serialization.
 """
 
-from typing import Dict, List, Optional, Any, Literal
-from pydantic import BaseModel, Field, model_validator
+import base64
+from typing import Dict, List, Optional, Any, Literal, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    model_validator,
+)
 
 from config import (
     PARAM_DEFINITIONS,
@@ -23,7 +31,12 @@ from config import (
 # =============================================================================
 
 class SimulationParams(BaseModel):
-    """Validated simulation parameters."""
+    """Validated simulation parameters (immutable; use with_updates)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Serialized form, built on first to_dict() call
+    _dict_cache: Optional[Dict[str, Any]] = PrivateAttr(default=None)
 
     # Primary parameters
     num_boids: int = Field(
@@ -160,7 +173,36 @@ class SimulationParams(BaseModel):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return self.model_dump()
+        # Frozen, so the dump can be computed once; hand out copies
+        if self._dict_cache is None:
+            self._dict_cache = self.model_dump()
+        return dict(self._dict_cache)
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "SimulationParams":
+        """Copy the model; the copy rebuilds its own to_dict() cache."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._dict_cache = None
+        return copied
+
+    def with_updates(self, updates: Dict[str, Any]) -> "SimulationParams":
+        """
+        Return params with updates applied, validating only when needed.
+        
+        Updates that name unknown fields or repeat current values (e.g. a
+        slider echoing its position) return self without revalidation.
+        
+        Raises:
+            pydantic.ValidationError: If the merged parameters are invalid
+        """
+        changed = {
+            key: value for key, value in updates.items()
+            if key in type(self).model_fields and getattr(self, key) != value
+        }
+        if not changed:
+            return self
+        return type(self)(**{**self.to_dict(), **changed})
 
 
 # =============================================================================
@@ -189,7 +231,7 @@ class PresetMessage(BaseModel):
     def validate_preset_name(self):
         """Ensure preset name is valid."""
         if self.name not in VALID_PRESETS:
-            raise ValueError(f"Invalid preset: {self.name}. Valid: {VALID_PRESETS}")
+            raise ValueError(f"Invalid preset: {self.name}. Valid: {sorted(VALID_PRESETS)}")
         return self
 
 
@@ -245,8 +287,11 @@ class FrameData(BaseModel):
         default=SimulationMode.MODE_2D,
         description="Simulation mode: '2d' or '3d'"
     )
-    boids: List[List[float]] = Field(
-        description="List of [x, y, vx, vy] (2D) or [x, y, z, vx, vy, vz] (3D) for each boid"
+    boids: Union[List[List[float]], bytes] = Field(
+        description=(
+            "List of [x, y, vx, vy] (2D) or [x, y, z, vx, vy, vz] (3D) for each boid, "
+            "or the same rows as packed little-endian float32 (sent base64-encoded)"
+        )
     )
     predator: Optional[List[float]] = Field(
         default=None,
@@ -256,9 +301,12 @@ class FrameData(BaseModel):
         default_factory=list,
         description="List of predator data with position, velocity, strategy"
     )
-    obstacles: List[List[float]] = Field(
+    obstacles: Optional[List[List[float]]] = Field(
         default_factory=list,
-        description="List of [x, y, radius] (2D) or [x, y, z, radius] (3D) for each obstacle"
+        description=(
+            "List of [x, y, radius] (2D) or [x, y, z, radius] (3D) for each obstacle; "
+            "null when unchanged since the previous frame"
+        )
     )
     metrics: Optional[FrameMetrics] = Field(
         default=None,
@@ -270,6 +318,13 @@ class FrameData(BaseModel):
         description="Simulation bounds {width, height, depth} for 3D mode"
     )
 
+    @field_serializer("boids")
+    def _serialize_boids(self, boids: Union[List[List[float]], bytes]):
+        """Emit packed boid buffers as base64 text; nested lists pass through."""
+        if isinstance(boids, bytes):
+            return base64.b64encode(boids).decode("ascii")
+        return boids
+
 
 class ParamsSyncMessage(BaseModel):
     """Message to sync all parameters to client."""
@@ -289,28 +344,27 @@ class ErrorMessage(BaseModel):
 # Message Parsing Helper
 # =============================================================================
 
+# Client message type -> model that validates it
+CLIENT_MESSAGE_MODELS: Dict[str, type] = {
+    MessageType.UPDATE_PARAMS: UpdateParamsMessage,
+    MessageType.RESET: ResetMessage,
+    MessageType.PRESET: PresetMessage,
+    MessageType.PAUSE: PauseMessage,
+    MessageType.RESUME: ResumeMessage,
+    MessageType.SET_MODE: SetModeMessage,
+}
+
+
 def parse_client_message(data: Dict[str, Any]) -> Optional[BaseModel]:
     """
     Parse incoming WebSocket message from client.
     
     Returns the appropriate message model, or None if invalid.
     """
-    msg_type = data.get("type")
-    
     try:
-        if msg_type == MessageType.UPDATE_PARAMS:
-            return UpdateParamsMessage(**data)
-        elif msg_type == MessageType.RESET:
-            return ResetMessage(**data)
-        elif msg_type == MessageType.PRESET:
-            return PresetMessage(**data)
-        elif msg_type == MessageType.PAUSE:
-            return PauseMessage(**data)
-        elif msg_type == MessageType.RESUME:
-            return ResumeMessage(**data)
-        elif msg_type == MessageType.SET_MODE:
-            return SetModeMessage(**data)
-        else:
+        model = CLIENT_MESSAGE_MODELS.get(data.get("type"))
+        if model is None:
             return None
+        return model.model_validate(data)
     except Exception:
         return None
\ No newline at end of file
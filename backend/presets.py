@@ -4,16 +4,17 @@ Preset configurations for the Boids Interactive Demo.
 Defines parameter presets for interesting flock behaviors.
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
-from config import DEFAULT_PARAMS, PresetName, VALID_PRESETS
+from config import DEFAULT_PARAMS, PresetName, VALID_PRESETS, validate_param
 
 
 # =============================================================================
 # Preset Definitions
 # =============================================================================
 
-PRESETS: Dict[str, Dict[str, Any]] = {
+_PRESET_DEFINITIONS: Dict[str, Dict[str, Any]] = {
     PresetName.DEFAULT: {
         **DEFAULT_PARAMS,
     },
@@ -86,11 +87,35 @@ PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
+def _validate_preset(name: str, values: Dict[str, Any]) -> None:
+    """
+    Check every numeric preset value against its parameter limits.
+    
+    Raises:
+        ValueError: If a value is outside its limits or names an unknown param
+    """
+    for param, value in values.items():
+        if isinstance(value, (bool, str)):
+            continue  # predator_enabled / simulation_mode have no numeric range
+        ok, error = validate_param(param, value)
+        if not ok:
+            raise ValueError(f"Invalid preset {name!r}: {error}")
+
+
+for _name, _values in _PRESET_DEFINITIONS.items():
+    _validate_preset(_name, _values)
+
+# Validated once at import; read-only so callers cannot alter shared presets
+PRESETS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    name: MappingProxyType(values) for name, values in _PRESET_DEFINITIONS.items()
+})
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_preset(name: str) -> Optional[Dict[str, Any]]:
+def get_preset(name: str) -> Optional[Mapping[str, Any]]:
     """
     Get a preset configuration by name.
     
@@ -98,12 +123,12 @@ def get_preset(name: str) -> Optional[Dict[str, Any]]:
         name: Preset name (use PresetName constants)
         
     Returns:
-        Dictionary of parameters, or None if not found
+        Read-only mapping of parameters, or None if not found
     """
     return PRESETS.get(name)
 
 
-def get_preset_params(name: str) -> Dict[str, Any]:
+def get_preset_params(name: str) -> Mapping[str, Any]:
     """
     Get a preset configuration, falling back to default.
     
@@ -111,7 +136,7 @@ def get_preset_params(name: str) -> Dict[str, Any]:
         name: Preset name
         
     Returns:
-        Dictionary of parameters (default if name not found)
+        Read-only mapping of parameters (default if name not found)
     """
     return PRESETS.get(name, PRESETS[PresetName.DEFAULT])
 
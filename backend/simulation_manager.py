@@ -12,11 +12,7 @@ import numpy as np
 
 from boids import FlockOptimized, SimulationParams as FlockSimParams
 from boids.flock3d import Flock3D, SimulationParams3D
-from boids.metrics import (
-    compute_avg_distance_to_predator,
-    compute_min_distance_to_predator,
-    compute_flock_cohesion,
-)
+from boids.metrics import compute_predator_metrics
 from config import (
     SIMULATION_WIDTH, SIMULATION_HEIGHT, SIMULATION_DEPTH, 
     TARGET_FPS, DEFAULT_PARAMS, SimulationMode
@@ -24,6 +20,31 @@ from config import (
 from models import SimulationParams, FrameData, FrameMetrics
 
 
+# FPS smoothing: EWMA weight equivalent to a 30-sample moving average
+FPS_SMOOTHING_SAMPLES = 30
+FPS_SMOOTHING_ALPHA = 2.0 / (FPS_SMOOTHING_SAMPLES + 1)
+
+# Predator metrics are recomputed every N frames (10 Hz at 60 FPS)
+METRICS_STRIDE = 6
+
+# Parameters that can be pushed into a running flock without recreating it
+LIVE_FLOCK_PARAMS = (
+    'visual_range',
+    'protected_range',
+    'max_speed',
+    'min_speed',
+    'cohesion_factor',
+    'alignment_factor',
+    'separation_strength',
+    'margin',
+    'turn_factor',
+    'predator_speed',
+    'predator_avoidance_strength',
+    'predator_detection_range',
+    'predator_hunting_strength',
+)
+
+
 class SimulationManager:
     """
     Manages simulation state for a single client.
@@ -37,10 +58,28 @@ class SimulationManager:
     - Mode switching (2D <-> 3D)
     """
 
+    # Fixed attribute layout: faster per-frame attribute access, no __dict__
+    __slots__ = (
+        '_params',
+        '_seed',
+        '_pack_boids',
+        '_flock',
+        '_frame_id',
+        '_paused',
+        '_running',
+        '_last_frame_ns',
+        '_fps',
+        '_boids_buf',
+        '_last_frame',
+        '_obstacles_dirty',
+        '_frame',
+    )
+
     def __init__(
         self,
         params: Optional[SimulationParams] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        pack_boids: bool = False
     ):
         """
         Initialize simulation manager.
@@ -48,18 +87,32 @@ class SimulationManager:
         Args:
             params: Initial simulation parameters (uses defaults if None)
             seed: Random seed for reproducibility (random if None)
+            pack_boids: Send frame boids as one packed float32 buffer
+                instead of nested lists
         """
         self._params = params or SimulationParams()
         self._seed = seed
+        self._pack_boids = pack_boids
         self._flock: Optional[Union[FlockOptimized, Flock3D]] = None
         self._frame_id: int = 0
         self._paused: bool = False
         self._running: bool = False
         
         # FPS tracking
-        self._last_frame_time: float = time.time()
+        self._last_frame_ns: int = time.perf_counter_ns()
         self._fps: float = TARGET_FPS
-        self._fps_samples: List[float] = []
+        
+        # float32 staging buffer for packed boid frames (resized with the flock)
+        self._boids_buf: np.ndarray = np.empty((0, 4), dtype='<f4')
+        
+        # Last serialized frame, reused verbatim while paused
+        self._last_frame: Optional[FrameData] = None
+        
+        # Obstacles are only sent in a frame after they change
+        self._obstacles_dirty: bool = True
+        
+        # Pooled frame objects, refilled in place every frame
+        self._frame = FrameData(frame_id=0, boids=[], metrics=FrameMetrics(fps=TARGET_FPS))
         
         # Initialize flock
         self._init_flock()
@@ -74,11 +127,27 @@ class SimulationManager:
         if self._seed is not None:
             np.random.seed(self._seed)
         
+        self._last_frame = None
+        self._obstacles_dirty = True
+        # Force throttled predator metrics to be recomputed for the new flock
+        self._frame.metrics.avg_distance_to_predator = None
+        
         if self.is_3d:
             self._init_flock_3d()
         else:
             self._init_flock_2d()
 
+    def _pack_boid_rows(self, rows: List[List[float]]) -> Union[List[List[float]], bytes]:
+        """Return boid rows as-is, or as packed float32 bytes if pack_boids is set."""
+        if not self._pack_boids:
+            return rows
+        shape = (len(rows), 6 if self.is_3d else 4)
+        if self._boids_buf.shape != shape:
+            self._boids_buf = np.empty(shape, dtype='<f4')
+        if rows:
+            self._boids_buf[...] = rows
+        return self._boids_buf.tobytes()
+
     def _init_flock_2d(self) -> None:
         """Create 2D flock from current parameters."""
         flock_params = FlockSimParams(
@@ -144,7 +213,7 @@ class SimulationManager:
     def start(self) -> None:
         """Start the simulation."""
         self._running = True
-        self._last_frame_time = time.time()
+        self._last_frame_ns = time.perf_counter_ns()
 
     def stop(self) -> None:
         """Stop the simulation."""
@@ -157,6 +226,7 @@ class SimulationManager:
     def resume(self) -> None:
         """Resume the simulation."""
         self._paused = False
+        self._last_frame = None
 
     @property
     def is_running(self) -> bool:
@@ -174,28 +244,40 @@ class SimulationManager:
 
     def update(self) -> None:
         """Advance simulation by one frame (if not paused)."""
-        if self._paused:
+        self.update_n(1)
+
+    def update_n(self, steps: int) -> None:
+        """
+        Advance simulation by several physics steps (if not paused).
+        
+        Lets one network tick carry multiple simulation steps, so the
+        per-frame overhead (metrics, serialization) is paid once.
+        
+        Args:
+            steps: Number of physics steps to run
+        """
+        if self._paused or steps < 1:
             return
         
-        self._flock.update()
-        self._frame_id += 1
-        
-        # Update FPS tracking
-        now = time.time()
-        delta = now - self._last_frame_time
-        if delta > 0:
-            instant_fps = 1.0 / delta
-            self._fps_samples.append(instant_fps)
-            # Keep last 30 samples for averaging
-            if len(self._fps_samples) > 30:
-                self._fps_samples.pop(0)
-            self._fps = sum(self._fps_samples) / len(self._fps_samples)
-        self._last_frame_time = now
+        flock_update = self._flock.update
+        for _ in range(steps):
+            flock_update()
+        self._frame_id += steps
+        self._last_frame = None
+        
+        # Update FPS tracking (monotonic clock, integer nanoseconds)
+        now_ns = time.perf_counter_ns()
+        delta_ns = now_ns - self._last_frame_ns
+        if delta_ns > 0:
+            instant_fps = 1e9 / delta_ns
+            # Exponentially-weighted moving average (O(1), no sample window)
+            self._fps += FPS_SMOOTHING_ALPHA * (instant_fps - self._fps)
+        self._last_frame_ns = now_ns
 
     def reset(self) -> None:
         """Reset simulation with current parameters."""
         self._frame_id = 0
-        self._fps_samples = []
+        self._fps = TARGET_FPS
         self._init_flock()
 
     # =========================================================================
@@ -209,6 +291,8 @@ class SimulationManager:
         Args:
             updates: Dictionary of parameter updates (partial)
         """
+        self._last_frame = None
+        
         # Check if mode changed (requires full recreation)
         mode_changed = (
             'simulation_mode' in updates and 
@@ -232,16 +316,15 @@ class SimulationManager:
             updates['depth'] != self._params.depth
         )
         
-        # Apply updates to params
-        current_dict = self._params.to_dict()
-        current_dict.update(updates)
-        
-        # Validate and create new params
+        # Validate and apply updates (no-op updates keep the same params)
         try:
-            self._params = SimulationParams(**current_dict)
+            new_params = self._params.with_updates(updates)
         except Exception:
             # If validation fails, keep old params
             return
+        if new_params is self._params:
+            return
+        self._params = new_params
         
         # Mode change requires full recreation
         if mode_changed or (depth_changed and self.is_3d):
@@ -272,43 +355,11 @@ class SimulationManager:
             self._flock.set_num_predators(count)
 
     def _update_flock_params(self) -> None:
-        """Update flock parameters without recreation."""
-        if self.is_3d:
-            self._update_flock_params_3d()
-        else:
-            self._update_flock_params_2d()
-
-    def _update_flock_params_2d(self) -> None:
-        """Update 2D flock parameters without recreation."""
-        self._flock.params.visual_range = self._params.visual_range
-        self._flock.params.protected_range = self._params.protected_range
-        self._flock.params.max_speed = self._params.max_speed
-        self._flock.params.min_speed = self._params.min_speed
-        self._flock.params.cohesion_factor = self._params.cohesion_factor
-        self._flock.params.alignment_factor = self._params.alignment_factor
-        self._flock.params.separation_strength = self._params.separation_strength
-        self._flock.params.margin = self._params.margin
-        self._flock.params.turn_factor = self._params.turn_factor
-        self._flock.params.predator_speed = self._params.predator_speed
-        self._flock.params.predator_avoidance_strength = self._params.predator_avoidance_strength
-        self._flock.params.predator_detection_range = self._params.predator_detection_range
-        self._flock.params.predator_hunting_strength = self._params.predator_hunting_strength
-
-    def _update_flock_params_3d(self) -> None:
-        """Update 3D flock parameters without recreation."""
-        self._flock.params.visual_range = self._params.visual_range
-        self._flock.params.protected_range = self._params.protected_range
-        self._flock.params.max_speed = self._params.max_speed
-        self._flock.params.min_speed = self._params.min_speed
-        self._flock.params.cohesion_factor = self._params.cohesion_factor
-        self._flock.params.alignment_factor = self._params.alignment_factor
-        self._flock.params.separation_strength = self._params.separation_strength
-        self._flock.params.margin = self._params.margin
-        self._flock.params.turn_factor = self._params.turn_factor
-        self._flock.params.predator_speed = self._params.predator_speed
-        self._flock.params.predator_avoidance_strength = self._params.predator_avoidance_strength
-        self._flock.params.predator_detection_range = self._params.predator_detection_range
-        self._flock.params.predator_hunting_strength = self._params.predator_hunting_strength
+        """Update flock parameters without recreation (2D and 3D)."""
+        params = self._params.to_dict()
+        vars(self._flock.params).update(
+            {name: params[name] for name in LIVE_FLOCK_PARAMS}
+        )
 
     def set_mode(self, mode: str) -> None:
         """
@@ -325,7 +376,7 @@ class SimulationManager:
                 **{**self._params.to_dict(), 'simulation_mode': mode}
             )
             self._frame_id = 0
-            self._fps_samples = []
+            self._fps = TARGET_FPS
             self._init_flock()
 
     def get_params(self) -> SimulationParams:
@@ -344,21 +395,32 @@ class SimulationManager:
         """
         Get current frame data for sending to client.
         
+        The returned FrameData is a pooled instance that is refilled on
+        the next call; copy out any values that must outlive the frame.
+        While paused, the last serialized frame is returned as-is since
+        no state has changed since it was built.
+        
         Returns:
             FrameData with boids, predators, obstacles, and metrics
         """
+        if self._paused and self._last_frame is not None:
+            return self._last_frame
+        
         if self.is_3d:
-            return self._get_frame_data_3d()
+            frame = self._get_frame_data_3d()
         else:
-            return self._get_frame_data_2d()
+            frame = self._get_frame_data_2d()
+        
+        self._last_frame = frame
+        return frame
 
     def _get_frame_data_2d(self) -> FrameData:
         """Get 2D frame data."""
         # Serialize boids: [[x, y, vx, vy], ...]
-        boids_data = [
+        boids_data = self._pack_boid_rows([
             [b.x, b.y, b.vx, b.vy]
             for b in self._flock.boids
-        ]
+        ])
         
         # Serialize all predators with strategy info
         predators_data = [
@@ -379,51 +441,52 @@ class SimulationManager:
             p = self._flock.predators[0]
             predator_data = [p.x, p.y, p.vx, p.vy]
         
-        # Serialize obstacles
-        obstacles_data = [
-            [obs.x, obs.y, obs.radius]
-            for obs in self._flock.obstacles
-        ]
+        # Serialize obstacles (None = unchanged since the last frame)
+        obstacles_data = None
+        if self._obstacles_dirty:
+            obstacles_data = [
+                [obs.x, obs.y, obs.radius]
+                for obs in self._flock.obstacles
+            ]
+            self._obstacles_dirty = False
         
-        # Compute metrics if predator is active (uses first predator)
-        metrics = None
+        # Compute metrics if predator is active (uses first predator),
+        # throttled to every METRICS_STRIDE frames; fps is always fresh.
+        # Values are sent unrounded; display precision is a client concern.
+        metrics = self._frame.metrics
+        metrics.fps = self._fps
         if self._flock.predator is not None:
-            metrics = FrameMetrics(
-                fps=round(self._fps, 1),
-                avg_distance_to_predator=round(
-                    compute_avg_distance_to_predator(
-                        self._flock.boids, self._flock.predator
-                    ), 1
-                ),
-                min_distance_to_predator=round(
-                    compute_min_distance_to_predator(
-                        self._flock.boids, self._flock.predator
-                    ), 1
-                ),
-                flock_cohesion=round(
-                    compute_flock_cohesion(self._flock.boids), 1
-                )
-            )
+            if (
+                self._frame_id % METRICS_STRIDE == 0
+                or metrics.avg_distance_to_predator is None
+            ):
+                (
+                    metrics.avg_distance_to_predator,
+                    metrics.min_distance_to_predator,
+                    metrics.flock_cohesion,
+                ) = compute_predator_metrics(self._flock.boids, self._flock.predator)
         else:
-            metrics = FrameMetrics(fps=round(self._fps, 1))
-        
-        return FrameData(
-            frame_id=self._frame_id,
-            mode=SimulationMode.MODE_2D,
-            boids=boids_data,
-            predator=predator_data,
-            predators=predators_data,
-            obstacles=obstacles_data,
-            metrics=metrics
-        )
+            metrics.avg_distance_to_predator = None
+            metrics.min_distance_to_predator = None
+            metrics.flock_cohesion = None
+        
+        frame = self._frame
+        frame.frame_id = self._frame_id
+        frame.mode = SimulationMode.MODE_2D
+        frame.boids = boids_data
+        frame.predator = predator_data
+        frame.predators = predators_data
+        frame.obstacles = obstacles_data
+        frame.bounds = None
+        return frame
 
     def _get_frame_data_3d(self) -> FrameData:
         """Get 3D frame data."""
         # Serialize boids: [[x, y, z, vx, vy, vz], ...]
-        boids_data = [
+        boids_data = self._pack_boid_rows([
             [b.x, b.y, b.z, b.vx, b.vy, b.vz]
             for b in self._flock.boids
-        ]
+        ])
         
         # Serialize all predators with strategy info and z coordinates
         predators_data = [
@@ -440,29 +503,35 @@ class SimulationManager:
             for p in self._flock.predators
         ]
         
-        # Serialize obstacles (spheres in 3D)
-        obstacles_data = [
-            [obs.x, obs.y, obs.z, obs.radius]
-            for obs in self._flock.obstacles
-        ]
+        # Serialize obstacles (spheres in 3D; None = unchanged)
+        obstacles_data = None
+        if self._obstacles_dirty:
+            obstacles_data = [
+                [obs.x, obs.y, obs.z, obs.radius]
+                for obs in self._flock.obstacles
+            ]
+            self._obstacles_dirty = False
         
         # Basic metrics for 3D (predator metrics would need 3D distance functions)
-        metrics = FrameMetrics(fps=round(self._fps, 1))
-        
-        return FrameData(
-            frame_id=self._frame_id,
-            mode=SimulationMode.MODE_3D,
-            boids=boids_data,
-            predator=None,  # No backward compat for 3D
-            predators=predators_data,
-            obstacles=obstacles_data,
-            metrics=metrics,
-            bounds={
-                "width": SIMULATION_WIDTH,
-                "height": SIMULATION_HEIGHT,
-                "depth": self._params.depth
-            }
-        )
+        metrics = self._frame.metrics
+        metrics.fps = self._fps
+        metrics.avg_distance_to_predator = None
+        metrics.min_distance_to_predator = None
+        metrics.flock_cohesion = None
+        
+        frame = self._frame
+        frame.frame_id = self._frame_id
+        frame.mode = SimulationMode.MODE_3D
+        frame.boids = boids_data
+        frame.predator = None  # No backward compat for 3D
+        frame.predators = predators_data
+        frame.obstacles = obstacles_data
+        frame.bounds = {
+            "width": SIMULATION_WIDTH,
+            "height": SIMULATION_HEIGHT,
+            "depth": self._params.depth
+        }
+        return frame
 
     # =========================================================================
     # Properties
@@ -512,6 +581,8 @@ class SimulationManager:
         Returns:
             Dictionary with obstacle data and index
         """
+        self._last_frame = None
+        self._obstacles_dirty = True
         if self.is_3d:
             from boids.obstacle3d import Obstacle3D
             # Default z to center of depth if not provided
@@ -520,6 +591,7 @@ class SimulationManager:
             obstacle = Obstacle3D(x, y, z, radius)
             self._flock.add_obstacle(obstacle)
             index = len(self._flock.obstacles) - 1
+            self._ensure_obs_capacity(index + 1)
             return {
                 'index': index,
                 'x': obstacle.x,
@@ -530,6 +602,7 @@ class SimulationManager:
         else:
             obstacle = self._flock.add_obstacle(x, y, radius)
             index = len(self._flock.obstacles) - 1
+            self._ensure_obs_capacity(index + 1)
             return {
                 'index': index,
                 'x': obstacle.x,
@@ -547,6 +620,8 @@ class SimulationManager:
         Returns:
             True if removed, False if invalid index
         """
+        self._last_frame = None
+        self._obstacles_dirty = True
         if self.is_3d:
             self._flock.remove_obstacle(index)
             return True
@@ -559,6 +634,8 @@ class SimulationManager:
         Returns:
             Number of obstacles removed
         """
+        self._last_frame = None
+        self._obstacles_dirty = True
         if self.is_3d:
             count = len(self._flock.obstacles)
             self._flock.clear_obstacles()
@@ -1,10 +1,40 @@
 """
 Pytest configuration and fixtures for backend tests.
+
+Long-running stress and diagnostic tests are marked ``slow`` and skipped
+by default; run them with ``pytest --run-slow``.
 """
 
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend directory to path for imports
 backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
\ No newline at end of file
+sys.path.insert(0, str(backend_dir))
+
+
+def pytest_addoption(parser):
+    """Register the --run-slow command line option."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="also run tests marked as slow",
+    )
+
+
+def pytest_configure(config):
+    """Register the slow marker."""
+    config.addinivalue_line("markers", "slow: long-running test, skipped unless --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow was passed."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -3,6 +3,7 @@ Tests for configuration module.
 """
 
 import pytest
+import numpy as np
 from config import (
     SIMULATION_WIDTH,
     SIMULATION_HEIGHT,
@@ -22,6 +23,33 @@ from config import (
 )
 
 
+EXPECTED_PARAMS = frozenset({
+    'num_boids', 'visual_range', 'separation_strength',
+    'predator_enabled', 'predator_speed', 'predator_avoidance_strength',
+    'protected_range', 'cohesion_factor', 'alignment_factor',
+    'max_speed', 'min_speed', 'margin', 'turn_factor',
+    'predator_detection_range', 'predator_hunting_strength',
+})
+
+EXPECTED_PRESETS = frozenset({
+    PresetName.DEFAULT, PresetName.TIGHT_SWARM, PresetName.LOOSE_CLOUD,
+    PresetName.HIGH_SPEED, PresetName.SLOW_DANCE, PresetName.PREDATOR_CHASE,
+    PresetName.SWARM_DEFENSE,
+})
+
+# Parameter limits as arrays aligned with PARAM_NAMES, for vectorized checks
+PARAM_NAMES = list(PARAM_DEFINITIONS)
+PARAM_MINS = np.array([PARAM_DEFINITIONS[n].min for n in PARAM_NAMES], dtype=float)
+PARAM_MAXS = np.array([PARAM_DEFINITIONS[n].max for n in PARAM_NAMES], dtype=float)
+PARAM_DEFAULTS = np.array([PARAM_DEFINITIONS[n].default for n in PARAM_NAMES], dtype=float)
+PARAM_STEPS = np.array([PARAM_DEFINITIONS[n].step for n in PARAM_NAMES], dtype=float)
+
+
+def failing(ok: np.ndarray) -> list:
+    """Names of the parameters where a vectorized check is False."""
+    return [PARAM_NAMES[i] for i in np.flatnonzero(~ok)]
+
+
 class TestSimulationConstants:
     """Tests for simulation constants."""
 
@@ -51,19 +79,18 @@ class TestParamDefinitions:
 
     def test_defaults_within_limits(self):
         """All defaults are within min/max limits."""
-        for name, defn in PARAM_DEFINITIONS.items():
-            assert defn.min <= defn.default <= defn.max, \
-                f"{name}: default {defn.default} not in [{defn.min}, {defn.max}]"
+        ok = (PARAM_DEFAULTS >= PARAM_MINS) & (PARAM_DEFAULTS <= PARAM_MAXS)
+        assert ok.all(), f"Defaults outside [min, max]: {failing(ok)}"
 
     def test_min_less_than_max(self):
         """Min is always less than max."""
-        for name, defn in PARAM_DEFINITIONS.items():
-            assert defn.min < defn.max, f"{name}: min >= max"
+        ok = PARAM_MINS < PARAM_MAXS
+        assert ok.all(), f"min >= max: {failing(ok)}"
 
     def test_step_positive(self):
         """Step values are positive."""
-        for name, defn in PARAM_DEFINITIONS.items():
-            assert defn.step > 0, f"{name}: step <= 0"
+        ok = PARAM_STEPS > 0
+        assert ok.all(), f"step <= 0: {failing(ok)}"
 
     def test_valid_categories(self):
         """All categories are valid."""
@@ -74,15 +101,8 @@ class TestParamDefinitions:
 
     def test_expected_params_exist(self):
         """Expected parameters are defined."""
-        expected = [
-            'num_boids', 'visual_range', 'separation_strength',
-            'predator_enabled', 'predator_speed', 'predator_avoidance_strength',
-            'protected_range', 'cohesion_factor', 'alignment_factor',
-            'max_speed', 'min_speed', 'margin', 'turn_factor',
-            'predator_detection_range', 'predator_hunting_strength'
-        ]
-        for param in expected:
-            assert param in PARAM_DEFINITIONS, f"Missing parameter: {param}"
+        missing = EXPECTED_PARAMS - PARAM_DEFINITIONS.keys()
+        assert not missing, f"Missing parameters: {sorted(missing)}"
 
     def test_param_count(self):
         """Correct number of parameters defined."""
@@ -151,59 +171,36 @@ class TestParamCategories:
 class TestValidation:
     """Tests for validate_param function."""
 
-    def test_valid_param(self):
-        """Valid parameter passes validation."""
-        is_valid, msg = validate_param('num_boids', 50)
-        assert is_valid is True
-        assert msg == ""
-
-    def test_at_min(self):
-        """Parameter at minimum is valid."""
-        is_valid, msg = validate_param('num_boids', 1)
-        assert is_valid is True
-
-    def test_at_max(self):
-        """Parameter at maximum is valid."""
-        is_valid, msg = validate_param('num_boids', 200)
-        assert is_valid is True
-
-    def test_below_min(self):
-        """Parameter below minimum fails."""
-        is_valid, msg = validate_param('num_boids', 0)
-        assert is_valid is False
-        assert 'must be >=' in msg
-
-    def test_above_max(self):
-        """Parameter above maximum fails."""
-        is_valid, msg = validate_param('num_boids', 300)
-        assert is_valid is False
-        assert 'must be <=' in msg
-
-    def test_unknown_param(self):
-        """Unknown parameter fails."""
-        is_valid, msg = validate_param('unknown_param', 50)
-        assert is_valid is False
-        assert 'Unknown parameter' in msg
+    @pytest.mark.parametrize("name,value,expect_valid,msg_part", [
+        pytest.param('num_boids', 50, True, "", id="valid"),
+        pytest.param('num_boids', 1, True, "", id="at_min"),
+        pytest.param('num_boids', 200, True, "", id="at_max"),
+        pytest.param('num_boids', 0, False, 'must be >=', id="below_min"),
+        pytest.param('num_boids', 300, False, 'must be <=', id="above_max"),
+        pytest.param('unknown_param', 50, False, 'Unknown parameter', id="unknown_param"),
+    ])
+    def test_validate_param(self, name, value, expect_valid, msg_part):
+        """validate_param accepts in-range values and explains rejections."""
+        is_valid, msg = validate_param(name, value)
+        assert is_valid is expect_valid
+        if expect_valid:
+            assert msg == ""
+        else:
+            assert msg_part in msg
 
 
 class TestClamp:
     """Tests for clamp_param function."""
 
-    def test_within_range(self):
-        """Value within range is unchanged."""
-        assert clamp_param('num_boids', 50) == 50
-
-    def test_below_min(self):
-        """Value below min is clamped to min."""
-        assert clamp_param('num_boids', -10) == 1
-
-    def test_above_max(self):
-        """Value above max is clamped to max."""
-        assert clamp_param('num_boids', 500) == 200
-
-    def test_unknown_param(self):
-        """Unknown parameter returns original value."""
-        assert clamp_param('unknown', 999) == 999
+    @pytest.mark.parametrize("name,value,expected", [
+        pytest.param('num_boids', 50, 50, id="within_range"),
+        pytest.param('num_boids', -10, 1, id="below_min"),
+        pytest.param('num_boids', 500, 200, id="above_max"),
+        pytest.param('unknown', 999, 999, id="unknown_param"),
+    ])
+    def test_clamp_param(self, name, value, expected):
+        """clamp_param clamps to [min, max] and passes unknown names through."""
+        assert clamp_param(name, value) == expected
 
 
 class TestGetDefault:
@@ -247,13 +244,8 @@ class TestPresets:
 
     def test_valid_presets_list(self):
         """VALID_PRESETS contains all presets."""
-        assert PresetName.DEFAULT in VALID_PRESETS
-        assert PresetName.TIGHT_SWARM in VALID_PRESETS
-        assert PresetName.LOOSE_CLOUD in VALID_PRESETS
-        assert PresetName.HIGH_SPEED in VALID_PRESETS
-        assert PresetName.SLOW_DANCE in VALID_PRESETS
-        assert PresetName.PREDATOR_CHASE in VALID_PRESETS
-        assert PresetName.SWARM_DEFENSE in VALID_PRESETS
+        missing = EXPECTED_PRESETS - set(VALID_PRESETS)
+        assert not missing, f"Missing presets: {sorted(missing)}"
 
     def test_preset_count(self):
         """Correct number of presets."""
@@ -3,20 +3,33 @@ Tests for FlockOptimized obstacle integration.
 """
 
 import pytest
-from boids import FlockOptimized, SimulationParams, Obstacle
+import numpy as np
+from boids import Boid, FlockOptimized, SimulationParams, Obstacle
+from boids.obstacle import compute_obstacle_avoidance, compute_obstacle_avoidance_batch
+
+
+@pytest.fixture(scope="module")
+def shared_flock():
+    """One flock for the obstacle management tests, which never step it."""
+    return FlockOptimized(num_boids=10)
 
 
 class TestFlockObstacleManagement:
     """Tests for obstacle add/remove/clear methods."""
 
+    @pytest.fixture
+    def flock(self, shared_flock):
+        """The shared flock with its obstacle list emptied."""
+        shared_flock.obstacles.clear()
+        return shared_flock
+
     def test_initial_no_obstacles(self):
         """Flock starts with no obstacles."""
         flock = FlockOptimized(num_boids=10)
         assert len(flock.obstacles) == 0
 
-    def test_add_obstacle(self):
+    def test_add_obstacle(self, flock):
         """Add obstacle creates and stores obstacle."""
-        flock = FlockOptimized(num_boids=10)
         obs = flock.add_obstacle(100, 200, radius=30)
         
         assert len(flock.obstacles) == 1
@@ -25,25 +38,22 @@ class TestFlockObstacleManagement:
         assert flock.obstacles[0].radius == 30
         assert obs is flock.obstacles[0]
 
-    def test_add_multiple_obstacles(self):
+    def test_add_multiple_obstacles(self, flock):
         """Can add multiple obstacles."""
-        flock = FlockOptimized(num_boids=10)
         flock.add_obstacle(100, 100)
         flock.add_obstacle(200, 200)
         flock.add_obstacle(300, 300)
         
         assert len(flock.obstacles) == 3
 
-    def test_add_obstacle_default_radius(self):
+    def test_add_obstacle_default_radius(self, flock):
         """Add obstacle uses default radius."""
-        flock = FlockOptimized(num_boids=10)
         obs = flock.add_obstacle(100, 100)
         
         assert obs.radius == 30.0
 
-    def test_remove_obstacle_valid(self):
+    def test_remove_obstacle_valid(self, flock):
         """Remove obstacle by valid index."""
-        flock = FlockOptimized(num_boids=10)
         flock.add_obstacle(100, 100)
         flock.add_obstacle(200, 200)
         
@@ -53,9 +63,8 @@ class TestFlockObstacleManagement:
         assert len(flock.obstacles) == 1
         assert flock.obstacles[0].x == 200
 
-    def test_remove_obstacle_invalid(self):
+    def test_remove_obstacle_invalid(self, flock):
         """Remove obstacle with invalid index returns False."""
-        flock = FlockOptimized(num_boids=10)
         flock.add_obstacle(100, 100)
         
         assert flock.remove_obstacle(-1) is False
@@ -63,9 +72,8 @@ class TestFlockObstacleManagement:
         assert flock.remove_obstacle(100) is False
         assert len(flock.obstacles) == 1
 
-    def test_clear_obstacles(self):
+    def test_clear_obstacles(self, flock):
         """Clear removes all obstacles."""
-        flock = FlockOptimized(num_boids=10)
         flock.add_obstacle(100, 100)
         flock.add_obstacle(200, 200)
         flock.add_obstacle(300, 300)
@@ -75,15 +83,13 @@ class TestFlockObstacleManagement:
         assert count == 3
         assert len(flock.obstacles) == 0
 
-    def test_clear_empty(self):
+    def test_clear_empty(self, flock):
         """Clear on empty list returns 0."""
-        flock = FlockOptimized(num_boids=10)
         count = flock.clear_obstacles()
         assert count == 0
 
-    def test_get_obstacles_returns_copy(self):
+    def test_get_obstacles_returns_copy(self, flock):
         """get_obstacles returns a copy, not the original list."""
-        flock = FlockOptimized(num_boids=10)
         flock.add_obstacle(100, 100)
         
         obstacles = flock.get_obstacles()
@@ -98,21 +104,17 @@ class TestFlockObstacleAvoidance:
     def test_boid_avoids_obstacle(self):
         """Boid near obstacle is pushed away."""
         params = SimulationParams(width=800, height=600)
-        flock = FlockOptimized(num_boids=1, params=params)
+        flock = FlockOptimized(num_boids=0, params=params)
         
         # Place boid near obstacle
-        boid = flock.boids[0]
-        boid.x = 100
-        boid.y = 100
-        boid.vx = 0
-        boid.vy = 0
+        boid = Boid(x=100, y=100, vx=0, vy=0)
+        flock.boids.append(boid)
         
         # Place obstacle to the left
         flock.add_obstacle(60, 100, radius=30)
         
         # Update
-        for _ in range(10):
-            flock.update()
+        flock.update_n(10)
         
         # Boid should have moved right (away from obstacle)
         assert boid.x > 100
@@ -120,21 +122,17 @@ class TestFlockObstacleAvoidance:
     def test_multiple_obstacles_avoidance(self):
         """Boid avoids multiple obstacles."""
         params = SimulationParams(width=800, height=600)
-        flock = FlockOptimized(num_boids=1, params=params)
+        flock = FlockOptimized(num_boids=0, params=params)
         
-        boid = flock.boids[0]
-        boid.x = 400
-        boid.y = 300
-        boid.vx = 0
-        boid.vy = 0
+        boid = Boid(x=400, y=300, vx=0, vy=0)
+        flock.boids.append(boid)
         
         # Obstacles on left and right
         flock.add_obstacle(350, 300, radius=30)  # Left
         flock.add_obstacle(450, 300, radius=30)  # Right
         
         # Update - boid should move up or down
-        for _ in range(20):
-            flock.update()
+        flock.update_n(20)
         
         # Y position should have changed significantly
         assert abs(boid.y - 300) > 10
@@ -150,12 +148,52 @@ class TestFlockObstacleAvoidance:
         flock.add_obstacle(600, 400, radius=30)
         
         # Run 100 frames
-        for _ in range(100):
-            flock.update()
+        flock.update_n(100)
         
         # Should complete without error
         assert len(flock.boids) == 50
 
+    def test_update_n_matches_repeated_update(self):
+        """update_n(k) reaches the same state as k update() calls."""
+        params = SimulationParams(width=800, height=600)
+        
+        np.random.seed(7)
+        stepped = FlockOptimized(num_boids=20, params=params)
+        stepped.add_obstacle(400, 300, radius=50)
+        np.random.seed(7)
+        batched = FlockOptimized(num_boids=20, params=params)
+        batched.add_obstacle(400, 300, radius=50)
+        
+        for _ in range(5):
+            stepped.update()
+        batched.update_n(5)
+        
+        np.testing.assert_array_equal(batched.get_positions(), stepped.get_positions())
+
+
+class TestObstacleAvoidanceBatch:
+    """Tests for the vectorized obstacle avoidance kernel."""
+
+    def test_batch_matches_per_boid(self):
+        """Batch avoidance equals compute_obstacle_avoidance for every boid."""
+        obstacles = [Obstacle(x=200, y=200, radius=40), Obstacle(x=260, y=220, radius=30)]
+        rng = np.random.default_rng(5)
+        positions = np.vstack([
+            rng.uniform(100, 360, (200, 2)),
+            [[200, 200], [215, 200]],  # at a center, inside an obstacle
+        ])
+        
+        expected = [compute_obstacle_avoidance(x, y, obstacles) for x, y in positions]
+        
+        np.testing.assert_allclose(
+            compute_obstacle_avoidance_batch(positions, obstacles), expected, atol=1e-12
+        )
+
+    def test_batch_no_obstacles(self):
+        """No obstacles means zero steering."""
+        result = compute_obstacle_avoidance_batch(np.ones((3, 2)), [])
+        np.testing.assert_array_equal(result, np.zeros((3, 2)))
+
 
 class TestPredatorObstacleAvoidance:
     """Tests for predator obstacle avoidance."""
@@ -176,8 +214,7 @@ class TestPredatorObstacleAvoidance:
         initial_x = predator.x
         
         # Update
-        for _ in range(10):
-            flock.update()
+        flock.update_n(10)
         
         # Predator should have moved (away from obstacle or toward prey)
         assert predator.x != initial_x or predator.y != 100
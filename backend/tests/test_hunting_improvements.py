@@ -17,7 +17,8 @@ from boids.predator import (
     CATCH_DISTANCE, 
     COOLDOWN_DURATION,
     CHASE_FAILURE_FRAMES,
-    EDGE_MARGIN
+    EDGE_MARGIN,
+    TARGET_RESCAN_FRAMES,
 )
 
 
@@ -71,6 +72,26 @@ class TestTargetTimeout:
         # frames_since_target_switch should be 0 or 1 after reset
         assert pred.frames_since_target_switch <= 1
 
+    def test_falcon_rescans_nearest_every_interval(self):
+        """Falcon keeps its target between rescans, then re-picks the nearest."""
+        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
+        boids = [
+            Boid(x=340, y=300, vx=0, vy=0),
+            Boid(x=470, y=300, vx=0, vy=0),
+        ]
+        
+        pred.update_velocity_by_strategy(boids, hunting_strength=0.1, width=WIDTH, height=HEIGHT)
+        assert pred.target_boid_index == 0
+        
+        # Boid 1 becomes nearest, but the target only changes on the rescan
+        boids[1].x = 420
+        for _ in range(TARGET_RESCAN_FRAMES - 1):
+            pred.update_velocity_by_strategy(boids, hunting_strength=0.1, width=WIDTH, height=HEIGHT)
+            assert pred.target_boid_index == 0
+        
+        pred.update_velocity_by_strategy(boids, hunting_strength=0.1, width=WIDTH, height=HEIGHT)
+        assert pred.target_boid_index == 1
+
     def test_osprey_respects_timeout(self):
         """Osprey (RANDOM_HUNTER) respects target timeout."""
         pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.RANDOM_HUNTER)
@@ -96,28 +117,29 @@ class TestTargetTimeout:
 class TestCatchAndCooldown:
     """Tests for catch detection and cooldown behavior."""
 
+    @pytest.fixture
+    def pred(self):
+        """Fresh nearest-hunter predator at the center of the world."""
+        return Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
+
     def test_cooldown_constants_exist(self):
         """Verify catch/cooldown constants are defined."""
         assert CATCH_DISTANCE == 15.0
         assert COOLDOWN_DURATION == 60
 
-    def test_is_in_cooldown_false_initially(self):
+    def test_is_in_cooldown_false_initially(self, pred):
         """New predator should not be in cooldown."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
-        
         assert not pred.is_in_cooldown
 
-    def test_is_in_cooldown_true_after_start(self):
+    def test_is_in_cooldown_true_after_start(self, pred):
         """Predator should be in cooldown after start_cooldown()."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.start_cooldown()
         
         assert pred.is_in_cooldown
         assert pred.cooldown_frames == COOLDOWN_DURATION
 
-    def test_cooldown_decrements(self):
+    def test_cooldown_decrements(self, pred):
         """Cooldown should decrement each frame."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.cooldown_frames = 10
         
         pred.update_cooldown()
@@ -126,9 +148,8 @@ class TestCatchAndCooldown:
         pred.update_cooldown()
         assert pred.cooldown_frames == 8
 
-    def test_cooldown_does_not_go_negative(self):
+    def test_cooldown_does_not_go_negative(self, pred):
         """Cooldown should not go below 0."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.cooldown_frames = 1
         
         pred.update_cooldown()
@@ -137,23 +158,18 @@ class TestCatchAndCooldown:
         pred.update_cooldown()
         assert pred.cooldown_frames == 0
 
-    def test_check_catch_true_when_close(self):
+    def test_check_catch_true_when_close(self, pred):
         """check_catch returns True when within catch distance."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
-        
         # Target at distance 10 (less than CATCH_DISTANCE of 15)
         assert pred.check_catch(410, 300)
 
-    def test_check_catch_false_when_far(self):
+    def test_check_catch_false_when_far(self, pred):
         """check_catch returns False when outside catch distance."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
-        
         # Target at distance 50 (more than CATCH_DISTANCE of 15)
         assert not pred.check_catch(450, 300)
 
-    def test_start_cooldown_resets_target(self):
+    def test_start_cooldown_resets_target(self, pred):
         """start_cooldown should reset target tracking state."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.target_boid_index = 5
         pred.frames_since_target_switch = 100
         
@@ -162,9 +178,8 @@ class TestCatchAndCooldown:
         assert pred.target_boid_index is None
         assert pred.frames_since_target_switch == 0
 
-    def test_falcon_enters_cooldown_on_catch(self):
+    def test_falcon_enters_cooldown_on_catch(self, pred):
         """Falcon should enter cooldown when catching prey."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.cooldown_frames = 0
         
         # Place boid within catch distance
@@ -174,9 +189,8 @@ class TestCatchAndCooldown:
         
         assert pred.is_in_cooldown
 
-    def test_predator_does_not_hunt_during_cooldown(self):
+    def test_predator_does_not_hunt_during_cooldown(self, pred):
         """Predator should not update velocity during cooldown."""
-        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
         pred.vx = 0
         pred.vy = 0
         pred.cooldown_frames = 10
@@ -343,6 +357,25 @@ class TestEdgeTargetAvoidance:
         assert result is not None
         assert result in [0, 1]
 
+    def test_select_target_with_positions_matches_list_path(self):
+        """Vectorized edge mask offers the same candidates as is_near_edge."""
+        from boids import boid_positions
+        
+        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
+        rng = np.random.default_rng(5)
+        boids = [Boid(x=x, y=y, vx=0, vy=0) for x, y in rng.uniform(0, 800, (40, 2))]
+        edge_only = [Boid(x=10, y=10, vx=0, vy=0), Boid(x=790, y=590, vx=0, vy=0)]
+        
+        def candidates(boids_list, valid_indices):
+            return [int(i) for i in valid_indices]
+        
+        for group in (boids, edge_only):
+            expected = pred.select_target_avoiding_edges(group, WIDTH, HEIGHT, candidates)
+            result = pred.select_target_avoiding_edges(
+                group, WIDTH, HEIGHT, candidates, positions=boid_positions(group)
+            )
+            assert result == expected
+
     def test_falcon_prefers_non_edge_targets(self):
         """Falcon should prefer hunting boids away from edges."""
         pred = Predator.create_at_position(200, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
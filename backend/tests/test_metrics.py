@@ -0,0 +1,68 @@
+"""
+Tests for predator-prey metrics.
+"""
+
+import pytest
+import numpy as np
+
+from boids import Boid, Predator
+from boids.metrics import (
+    compute_avg_distance_to_predator,
+    compute_min_distance_to_predator,
+    compute_flock_cohesion,
+    compute_predator_metrics,
+)
+
+
+class TestPredatorMetrics:
+    """Tests for the fused per-frame predator metrics."""
+
+    def test_matches_individual_metrics(self):
+        """Fused metrics equal the separate metric functions."""
+        np.random.seed(7)
+        boids = [Boid.create_random() for _ in range(25)]
+        predator = Predator(x=400, y=300, vx=0, vy=0)
+
+        avg_d, min_d, cohesion = compute_predator_metrics(boids, predator)
+
+        assert avg_d == pytest.approx(compute_avg_distance_to_predator(boids, predator))
+        assert min_d == pytest.approx(compute_min_distance_to_predator(boids, predator))
+        assert cohesion == pytest.approx(compute_flock_cohesion(boids))
+
+    def test_no_boids(self):
+        """Empty flock returns the same defaults as the separate metrics."""
+        predator = Predator(x=400, y=300, vx=0, vy=0)
+        assert compute_predator_metrics([], predator) == (0.0, float('inf'), 0.0)
+
+    def test_single_boid_zero_cohesion(self):
+        """A single boid has zero cohesion."""
+        predator = Predator(x=0, y=0, vx=0, vy=0)
+        boids = [Boid(x=3, y=4, vx=0, vy=0)]
+
+        avg_d, min_d, cohesion = compute_predator_metrics(boids, predator)
+
+        assert avg_d == pytest.approx(5.0)
+        assert min_d == pytest.approx(5.0)
+        assert cohesion == 0.0
+
+
+class TestDistanceToPredator:
+    """Tests for the vectorized distance metrics."""
+
+    def test_avg_and_min_distance(self):
+        """Average and minimum distance over a known layout."""
+        predator = Predator(x=0, y=0, vx=0, vy=0)
+        boids = [
+            Boid(x=3, y=4, vx=0, vy=0),    # 5
+            Boid(x=6, y=8, vx=0, vy=0),    # 10
+            Boid(x=0, y=15, vx=0, vy=0),   # 15
+        ]
+
+        assert compute_avg_distance_to_predator(boids, predator) == pytest.approx(10.0)
+        assert compute_min_distance_to_predator(boids, predator) == pytest.approx(5.0)
+
+    def test_empty_flock_defaults(self):
+        """Empty flock keeps the documented defaults."""
+        predator = Predator(x=0, y=0, vx=0, vy=0)
+        assert compute_avg_distance_to_predator([], predator) == 0.0
+        assert compute_min_distance_to_predator([], predator) == float('inf')
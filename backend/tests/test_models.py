@@ -2,6 +2,10 @@
 Tests for Pydantic models.
 """
 
+import base64
+import json
+
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -94,6 +98,48 @@ class TestSimulationParams:
         assert 'predator_enabled' in d
         assert len(d) == 15
 
+    def test_with_updates_unchanged_returns_self(self):
+        """No-op or unknown updates skip revalidation."""
+        params = SimulationParams()
+        assert params.with_updates({}) is params
+        assert params.with_updates({"num_boids": params.num_boids}) is params
+        assert params.with_updates({"not_a_param": 1}) is params
+
+    def test_with_updates_applies_changes(self):
+        """Changed values produce a new validated instance."""
+        params = SimulationParams()
+        updated = params.with_updates({"visual_range": 80})
+        assert updated.visual_range == 80
+        assert params.visual_range == DEFAULT_PARAMS["visual_range"]
+
+    def test_with_updates_validates_cross_field(self):
+        """Cross-field validators still run on the merged params."""
+        params = SimulationParams()
+        with pytest.raises(ValidationError):
+            params.with_updates({"min_speed": params.max_speed + 1})
+
+    def test_params_are_frozen(self):
+        """Fields cannot be reassigned; changes go through with_updates."""
+        params = SimulationParams()
+        with pytest.raises(ValidationError):
+            params.num_boids = 10
+
+    def test_to_dict_returns_independent_copies(self):
+        """Cached dump is not exposed to callers that mutate the result."""
+        params = SimulationParams()
+        d = params.to_dict()
+        d["visual_range"] = -1
+        assert params.to_dict()["visual_range"] == params.visual_range
+        assert params.to_dict() == params.model_dump()
+
+    def test_model_copy_does_not_reuse_dict_cache(self):
+        """model_copy(update=...) serializes the updated values."""
+        params = SimulationParams()
+        params.to_dict()
+        copied = params.model_copy(update={"num_boids": 7})
+        assert copied.to_dict()["num_boids"] == 7
+        assert params.to_dict()["num_boids"] == 50
+
 
 class TestUpdateParamsMessage:
     """Tests for UpdateParamsMessage."""
@@ -221,6 +267,20 @@ class TestFrameData:
         )
         assert frame.metrics.fps == 60.0
 
+    def test_packed_boids_serialize_as_base64(self):
+        """Packed float32 boids are emitted as base64 text."""
+        rows = np.array([[100, 200, 1.5, -0.5], [150, 250, -1.0, 2.0]], dtype='<f4')
+        frame = FrameData(frame_id=1, boids=rows.tobytes())
+        
+        payload = json.loads(frame.model_dump_json())
+        decoded = np.frombuffer(base64.b64decode(payload["boids"]), dtype='<f4')
+        np.testing.assert_array_equal(decoded.reshape(-1, 4), rows)
+
+    def test_list_boids_serialize_unchanged(self):
+        """Nested list boids are emitted as-is."""
+        frame = FrameData(frame_id=1, boids=[[100, 200, 1.5, -0.5]])
+        assert frame.model_dump()["boids"] == [[100, 200, 1.5, -0.5]]
+
 
 class TestParamsSyncMessage:
     """Tests for ParamsSyncMessage."""
@@ -295,6 +355,12 @@ class TestParseClientMessage:
         msg = parse_client_message(data)
         assert msg is None
 
+    def test_parse_unhashable_type(self):
+        """Non-string type (e.g. a list) returns None instead of raising."""
+        data = {"type": ["reset"]}
+        msg = parse_client_message(data)
+        assert msg is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
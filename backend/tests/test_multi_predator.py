@@ -3,32 +3,30 @@ Tests for multiple predator functionality.
 """
 
 import pytest
-from boids import FlockOptimized, SimulationParams
+import numpy as np
+from boids import Boid, FlockOptimized, SimulationParams
+from boids.rules_optimized import (
+    FlockState,
+    compute_all_rules_batch,
+    compute_all_rules_with_multi_predator_kdtree,
+)
 
 
 class TestMultiplePredatorsCreation:
     """Tests for creating multiple predators."""
 
-    def test_default_single_predator(self):
-        """Single predator created by default when enabled."""
-        flock = FlockOptimized(num_boids=10, enable_predator=True)
-        assert len(flock.predators) == 1
-        assert flock.predator is not None
-
-    def test_multiple_predators_on_init(self):
-        """Multiple predators created on init."""
-        flock = FlockOptimized(num_boids=10, enable_predator=True, num_predators=3)
-        assert len(flock.predators) == 3
-
-    def test_max_predators_clamped(self):
-        """Predator count clamped to max 5."""
-        flock = FlockOptimized(num_boids=10, enable_predator=True, num_predators=10)
-        assert len(flock.predators) == 5
-
-    def test_no_predators_when_disabled(self):
-        """No predators when not enabled."""
-        flock = FlockOptimized(num_boids=10, enable_predator=False, num_predators=3)
-        assert len(flock.predators) == 0
+    @pytest.mark.parametrize("enable_predator,num_predators,expected", [
+        (True, 1, 1),     # single predator by default when enabled
+        (True, 3, 3),     # multiple predators on init
+        (True, 10, 5),    # clamped to max 5
+        (False, 3, 0),    # none when not enabled
+    ])
+    def test_predator_count_on_init(self, enable_predator, num_predators, expected):
+        """Predator count on init follows enable flag and 1-5 clamp."""
+        flock = FlockOptimized(num_boids=10, enable_predator=enable_predator,
+                               num_predators=num_predators)
+        assert len(flock.predators) == expected
+        assert (flock.predator is not None) == (expected > 0)
 
 
 class TestPredatorBackwardCompatibility:
@@ -203,6 +201,53 @@ class TestMultiplePredatorSimulation:
         assert final_pos2 != initial_pos2
 
 
+class TestBatchedRules:
+    """Tests for the vectorized flocking rule kernel."""
+
+    @pytest.mark.parametrize("num_predators", [0, 3])
+    def test_batch_matches_per_boid_rules(self, num_predators):
+        """compute_all_rules_batch equals the per-boid KDTree rules."""
+        np.random.seed(21)
+        params = SimulationParams(width=800, height=600)
+        flock = FlockOptimized(num_boids=120, params=params,
+                               enable_predator=num_predators > 0,
+                               num_predators=max(1, num_predators))
+        state = FlockState(flock.boids)
+        predators = [(pred.x, pred.y) for pred in flock.predators]
+        kwargs = dict(
+            visual_range=params.visual_range,
+            protected_range=params.protected_range,
+            cohesion_factor=params.cohesion_factor,
+            alignment_factor=params.alignment_factor,
+            separation_strength=params.separation_strength,
+            predator_positions=predators,
+            predator_detection_range=params.predator_detection_range,
+            predator_avoidance_strength=params.predator_avoidance_strength,
+        )
+        
+        expected = [
+            compute_all_rules_with_multi_predator_kdtree(i, state, **kwargs)
+            for i in range(len(flock.boids))
+        ]
+        
+        np.testing.assert_allclose(compute_all_rules_batch(state, **kwargs), expected, atol=1e-9)
+
+    def test_speed_limits_batch_matches_scalar_when_min_exceeds_max(self):
+        """Batch clamp keeps the scalar max-before-min precedence."""
+        params = SimulationParams(width=800, height=600, min_speed=4.0, max_speed=1.0)
+        flock = FlockOptimized(num_boids=0, params=params)
+        velocities = np.array([[2.0, 0.0], [0.5, 0.0], [0.0, 3.0]])
+        
+        expected = []
+        for vx, vy in velocities:
+            boid = Boid(x=0, y=0, vx=vx, vy=vy)
+            flock.enforce_speed_limits(boid)
+            expected.append((boid.vx, boid.vy))
+        
+        flock._enforce_speed_limits_batch(velocities)
+        np.testing.assert_allclose(velocities, expected)
+
+
 class TestMultiplePredatorsWithObstacles:
     """Tests for multiple predators with obstacles."""
 
@@ -4,6 +4,7 @@ Tests for predator hunting strategies.
 
 import pytest
 import numpy as np
+from scipy.spatial.distance import pdist
 from boids import Predator, HuntingStrategy, FlockOptimized, SimulationParams
 from boids.boid import Boid
 
@@ -23,6 +24,23 @@ class TestHuntingStrategyEnum:
         """Exactly 5 strategies exist."""
         assert len(HuntingStrategy) == 5
 
+    def test_every_strategy_has_an_update(self):
+        """The dispatch table covers every strategy."""
+        from boids.predator import _STRATEGY_UPDATES
+        assert set(_STRATEGY_UPDATES) == set(HuntingStrategy)
+
+    def test_reassigned_strategy_is_dispatched(self):
+        """Changing predator.strategy switches the update used next call."""
+        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.CENTER_HUNTER)
+        boids = [Boid(x=350, y=300, vx=0, vy=0), Boid(x=600, y=300, vx=0, vy=0)]
+        
+        pred.update_velocity_by_strategy(boids)
+        assert pred.target_boid_index is None  # Hawk tracks no single boid
+        
+        pred.strategy = HuntingStrategy.NEAREST_HUNTER
+        pred.update_velocity_by_strategy(boids)
+        assert pred.target_boid_index == 0
+
 
 class TestPredatorCreation:
     """Tests for predator creation with strategies."""
@@ -61,34 +79,30 @@ class TestPredatorCreation:
         pred = Predator.create_random(strategy=HuntingStrategy.PATROL_HUNTER)
         assert pred.patrol_center is not None
 
+    def test_predator_and_boid_use_slots(self):
+        """Predator and Boid have a fixed attribute layout."""
+        pred = Predator.create_random()
+        boid = Boid.create_random()
+        assert not hasattr(pred, '__dict__')
+        assert not hasattr(boid, '__dict__')
+        with pytest.raises(AttributeError):
+            pred.unknown_attribute = 1
+
 
 class TestStrategyNames:
     """Tests for strategy names."""
 
-    def test_strategy_name_hawk(self):
-        """CENTER_HUNTER is Hawk."""
-        pred = Predator.create_random(strategy=HuntingStrategy.CENTER_HUNTER)
-        assert pred.strategy_name == "Hawk"
-
-    def test_strategy_name_falcon(self):
-        """NEAREST_HUNTER is Falcon."""
-        pred = Predator.create_random(strategy=HuntingStrategy.NEAREST_HUNTER)
-        assert pred.strategy_name == "Falcon"
-
-    def test_strategy_name_eagle(self):
-        """STRAGGLER_HUNTER is Eagle."""
-        pred = Predator.create_random(strategy=HuntingStrategy.STRAGGLER_HUNTER)
-        assert pred.strategy_name == "Eagle"
-
-    def test_strategy_name_kite(self):
-        """PATROL_HUNTER is Kite."""
-        pred = Predator.create_random(strategy=HuntingStrategy.PATROL_HUNTER)
-        assert pred.strategy_name == "Kite"
-
-    def test_strategy_name_osprey(self):
-        """RANDOM_HUNTER is Osprey."""
-        pred = Predator.create_random(strategy=HuntingStrategy.RANDOM_HUNTER)
-        assert pred.strategy_name == "Osprey"
+    @pytest.mark.parametrize("strategy,name", [
+        (HuntingStrategy.CENTER_HUNTER, "Hawk"),
+        (HuntingStrategy.NEAREST_HUNTER, "Falcon"),
+        (HuntingStrategy.STRAGGLER_HUNTER, "Eagle"),
+        (HuntingStrategy.PATROL_HUNTER, "Kite"),
+        (HuntingStrategy.RANDOM_HUNTER, "Osprey"),
+    ])
+    def test_strategy_name(self, strategy, name):
+        """Each strategy has its species name."""
+        pred = Predator.create_random(strategy=strategy)
+        assert pred.strategy_name == name
 
 
 class TestCenterHunter:
@@ -136,6 +150,21 @@ class TestNearestHunter:
         assert pred.vx < 0, "Should move left toward nearest boid"
         assert abs(pred.vy) < 0.01  # Should barely move in y
 
+    def test_compute_nearest_boid(self):
+        """compute_nearest_boid returns the closest boid, with or without positions."""
+        from boids import boid_positions
+        
+        pred = Predator.create_at_position(400, 300, strategy=HuntingStrategy.NEAREST_HUNTER)
+        boids = [
+            Boid(x=600, y=200, vx=0, vy=0),
+            Boid(x=380, y=310, vx=0, vy=0),
+            Boid(x=350, y=300, vx=0, vy=0),
+        ]
+        
+        assert pred.compute_nearest_boid(boids) is boids[1]
+        assert pred.compute_nearest_boid(boids, boid_positions(boids)) is boids[1]
+        assert pred.compute_nearest_boid([]) is None
+
 
 class TestStragglerHunter:
     """Tests for STRAGGLER_HUNTER (Eagle) strategy."""
@@ -297,21 +326,75 @@ class TestFlockOptimizedStrategies:
             flock.update()
         
         # Calculate average distance between predators
-        positions = [(p.x, p.y) for p in flock.predators]
-        total_dist = 0
-        count = 0
-        for i, p1 in enumerate(positions):
-            for p2 in positions[i+1:]:
-                dist = np.sqrt((p1[0]-p2[0])**2 + (p1[1]-p2[1])**2)
-                total_dist += dist
-                count += 1
-        
-        avg_dist = total_dist / count if count > 0 else 0
+        positions = np.array([(p.x, p.y) for p in flock.predators])
+        avg_dist = pdist(positions).mean() if len(positions) > 1 else 0
         
         # Predators should spread out (at least 50px average distance)
         # This is a soft check - strategies should lead to some spread
         assert avg_dist > 30  # Reasonable spread
 
+    def test_shared_positions_match_per_predator_gather(self):
+        """Passing a shared positions array steers exactly like gathering per call."""
+        from boids import boid_positions
+        
+        rng = np.random.default_rng(3)
+        boids = [
+            Boid(x=x, y=y, vx=0, vy=0) for x, y in rng.uniform(100, 500, (30, 2))
+        ]
+        positions = boid_positions(boids)
+        
+        for strategy in (HuntingStrategy.CENTER_HUNTER, HuntingStrategy.NEAREST_HUNTER,
+                         HuntingStrategy.STRAGGLER_HUNTER, HuntingStrategy.PATROL_HUNTER):
+            gathered = Predator.create_at_position(300, 300, strategy=strategy)
+            shared = Predator.create_at_position(300, 300, strategy=strategy)
+            shared.vx, shared.vy = gathered.vx, gathered.vy
+            shared.patrol_center = gathered.patrol_center
+            
+            for _ in range(5):
+                gathered.update_velocity_by_strategy(boids, hunting_strength=0.05)
+                shared.update_velocity_by_strategy(boids, hunting_strength=0.05, positions=positions)
+            
+            assert shared.target_boid_index == gathered.target_boid_index
+            assert (shared.vx, shared.vy) == pytest.approx((gathered.vx, gathered.vy))
+
+    def test_update_predators_with_given_positions(self):
+        """Passing the boid positions array matches gathering it internally."""
+        from boids import boid_positions
+        
+        np.random.seed(4)
+        gathered = FlockOptimized(num_boids=30, enable_predator=True, num_predators=5)
+        np.random.seed(4)
+        given = FlockOptimized(num_boids=30, enable_predator=True, num_predators=5)
+        
+        np.random.seed(9)
+        gathered.update_predators()
+        np.random.seed(9)
+        given.update_predators(boid_positions(given.boids))
+        
+        assert [(p.x, p.y, p.vx, p.vy) for p in given.predators] == \
+            [(p.x, p.y, p.vx, p.vy) for p in gathered.predators]
+
+    def test_batched_targets_match_per_predator_scan(self):
+        """_assign_targets picks the same nearest targets as each Falcon alone."""
+        from boids import boid_positions
+        
+        np.random.seed(11)
+        flock = FlockOptimized(num_boids=40, enable_predator=True, num_predators=4)
+        for pred in flock.predators:
+            pred.strategy = HuntingStrategy.NEAREST_HUNTER
+        positions = boid_positions(flock.boids)
+        
+        expected = []
+        for pred in flock.predators:
+            solo = Predator(x=pred.x, y=pred.y, vx=0, vy=0,
+                            strategy=HuntingStrategy.NEAREST_HUNTER)
+            solo.update_velocity_by_strategy(flock.boids, positions=positions)
+            expected.append(solo.target_boid_index)
+        
+        flock._assign_targets(positions)
+        
+        assert [pred.target_boid_index for pred in flock.predators] == expected
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
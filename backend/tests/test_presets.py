@@ -2,10 +2,13 @@
 Tests for preset configurations.
 """
 
+from collections.abc import Mapping
+
 import pytest
 
 from presets import (
     PRESETS,
+    _validate_preset,
     get_preset,
     get_preset_params,
     is_valid_preset,
@@ -45,6 +48,11 @@ class TestPresetDefinitions:
             for param in DEFAULT_PARAMS:
                 assert param in preset, f"{name} missing param: {param}"
 
+    def test_validate_preset_rejects_out_of_range(self):
+        """Import-time validation rejects values outside parameter limits."""
+        with pytest.raises(ValueError, match="max_speed"):
+            _validate_preset("broken", {**DEFAULT_PARAMS, "max_speed": 1e6})
+
     def test_preset_values_within_limits(self):
         """All preset values are within valid limits."""
         for name, preset in PRESETS.items():
@@ -111,10 +119,18 @@ class TestGetPreset:
     """Tests for get_preset function."""
 
     def test_get_valid_preset(self):
-        """Get valid preset returns dict."""
+        """Get valid preset returns a mapping."""
         preset = get_preset(PresetName.TIGHT_SWARM)
         assert preset is not None
-        assert isinstance(preset, dict)
+        assert isinstance(preset, Mapping)
+
+    def test_presets_are_read_only(self):
+        """Presets cannot be modified through the returned mapping."""
+        preset = get_preset(PresetName.DEFAULT)
+        with pytest.raises(TypeError):
+            preset["max_speed"] = 99
+        with pytest.raises(TypeError):
+            PRESETS["custom"] = {}
 
     def test_get_invalid_preset(self):
         """Get invalid preset returns None."""
@@ -8,16 +8,51 @@ import numpy as np
 from simulation_manager import SimulationManager
 from models import SimulationParams, FrameData, FrameMetrics
 
+# Params are frozen, so one validated instance can be shared across tests
+PREDATOR_PARAMS = SimulationParams(predator_enabled=True)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="class")
+def default_manager():
+    """One default manager shared by a class's read-only property checks."""
+    return SimulationManager()
+
+
+@pytest.fixture
+def small_manager():
+    """Seeded 8-boid manager for tests that don't depend on flock size."""
+    return SimulationManager(params=SimulationParams(num_boids=8), seed=42)
+
+
+@pytest.fixture(scope="class")
+def obs_manager():
+    """Single-boid manager shared by a class whose tests only touch obstacles."""
+    return SimulationManager(params=SimulationParams(num_boids=1), seed=42)
+
+
+@pytest.fixture
+def manager():
+    """Fresh default manager for tests that mutate state."""
+    return SimulationManager()
+
 
 class TestSimulationManagerInit:
     """Tests for SimulationManager initialization."""
 
-    def test_default_initialization(self):
-        """Default initialization works."""
-        manager = SimulationManager()
-        assert manager.num_boids == 50
-        assert manager.has_predator is False
-        assert manager.frame_id == 0
+    @pytest.mark.parametrize("attr,expected", [
+        ("num_boids", 50),
+        ("has_predator", False),
+        ("frame_id", 0),
+        ("is_running", False),
+        ("is_paused", False),
+    ])
+    def test_default_property(self, default_manager, attr, expected):
+        """Default manager exposes the expected initial state."""
+        assert getattr(default_manager, attr) == expected
 
     def test_custom_params(self):
         """Custom parameters are applied."""
@@ -36,49 +71,34 @@ class TestSimulationManagerInit:
         
         assert frame1.boids[0] == frame2.boids[0]
 
-    def test_default_not_running(self):
-        """Manager starts not running."""
-        manager = SimulationManager()
-        assert manager.is_running is False
-
-    def test_default_not_paused(self):
-        """Manager starts not paused."""
-        manager = SimulationManager()
-        assert manager.is_paused is False
-
     def test_with_predator_enabled(self):
         """Predator can be enabled at init."""
-        params = SimulationParams(predator_enabled=True)
-        manager = SimulationManager(params=params)
+        manager = SimulationManager(params=PREDATOR_PARAMS)
         assert manager.has_predator is True
 
 
 class TestSimulationManagerLifecycle:
     """Tests for start/stop/pause/resume."""
 
-    def test_start(self):
+    def test_start(self, manager):
         """Start sets running flag."""
-        manager = SimulationManager()
         manager.start()
         assert manager.is_running is True
 
-    def test_stop(self):
+    def test_stop(self, manager):
         """Stop clears running flag."""
-        manager = SimulationManager()
         manager.start()
         manager.stop()
         assert manager.is_running is False
 
-    def test_pause(self):
+    def test_pause(self, manager):
         """Pause sets paused flag."""
-        manager = SimulationManager()
         manager.start()
         manager.pause()
         assert manager.is_paused is True
 
-    def test_resume(self):
+    def test_resume(self, manager):
         """Resume clears paused flag."""
-        manager = SimulationManager()
         manager.start()
         manager.pause()
         manager.resume()
@@ -88,61 +108,129 @@ class TestSimulationManagerLifecycle:
 class TestSimulationManagerUpdate:
     """Tests for simulation update."""
 
-    def test_update_increments_frame_id(self):
+    def test_update_increments_frame_id(self, small_manager):
         """Update increments frame ID."""
-        manager = SimulationManager(seed=42)
-        assert manager.frame_id == 0
-        manager.update()
-        assert manager.frame_id == 1
-        manager.update()
-        assert manager.frame_id == 2
-
-    def test_update_changes_positions(self):
+        assert small_manager.frame_id == 0
+        small_manager.update()
+        assert small_manager.frame_id == 1
+        small_manager.update()
+        assert small_manager.frame_id == 2
+
+    def test_manager_uses_slots(self, small_manager):
+        """SimulationManager has a fixed attribute layout."""
+        assert not hasattr(small_manager, '__dict__')
+        with pytest.raises(AttributeError):
+            small_manager._unknown_attribute = 1
+
+    def test_update_n_matches_repeated_update(self):
+        """update_n(k) advances k steps, same as k update() calls."""
+        stepped = SimulationManager(seed=42)
+        batched = SimulationManager(seed=42)
+        for _ in range(3):
+            stepped.update()
+        batched.update_n(3)
+        
+        assert batched.frame_id == 3
+        assert batched.get_frame_data().boids == stepped.get_frame_data().boids
+
+    def test_update_changes_positions(self, small_manager):
         """Update changes boid positions."""
-        manager = SimulationManager(seed=42)
-        frame1 = manager.get_frame_data()
+        frame1 = small_manager.get_frame_data()
         initial_pos = frame1.boids[0][:2]  # x, y
         
-        manager.update()
+        small_manager.update()
         
-        frame2 = manager.get_frame_data()
+        frame2 = small_manager.get_frame_data()
         new_pos = frame2.boids[0][:2]
         
         # At least one coordinate should change
         assert initial_pos != new_pos
 
-    def test_paused_no_frame_increment(self):
+    def test_paused_no_frame_increment(self, small_manager):
         """Paused update does not increment frame."""
-        manager = SimulationManager(seed=42)
-        manager.pause()
-        manager.update()
-        assert manager.frame_id == 0
+        small_manager.pause()
+        small_manager.update()
+        assert small_manager.frame_id == 0
 
-    def test_paused_no_position_change(self):
+    def test_paused_no_position_change(self, small_manager):
         """Paused update does not move boids."""
-        manager = SimulationManager(seed=42)
-        frame1 = manager.get_frame_data()
+        frame1 = small_manager.get_frame_data()
         initial_pos = frame1.boids[0]
         
-        manager.pause()
-        manager.update()
+        small_manager.pause()
+        small_manager.update()
         
-        frame2 = manager.get_frame_data()
+        frame2 = small_manager.get_frame_data()
         assert frame2.boids[0] == initial_pos
 
+    def test_paused_reuses_last_frame(self, small_manager):
+        """Paused manager returns the cached frame instead of rebuilding."""
+        small_manager.update()
+        small_manager.pause()
+        frame1 = small_manager.get_frame_data()
+        frame2 = small_manager.get_frame_data()
+        assert frame2 is frame1
+        assert frame2.frame_id == 1
+
+    def test_paused_cache_invalidated_by_obstacles(self, small_manager):
+        """Obstacle changes while paused show up in the next frame."""
+        small_manager.pause()
+        small_manager.get_frame_data()
+        small_manager.add_obstacle(100, 100, radius=30)
+        frame = small_manager.get_frame_data()
+        assert len(frame.obstacles) == 1
+
+    def test_frame_object_reused(self, small_manager):
+        """FrameData is pooled and refilled rather than rebuilt."""
+        frame1 = small_manager.get_frame_data()
+        first_id = frame1.frame_id
+        small_manager.update()
+        frame2 = small_manager.get_frame_data()
+        assert frame2 is frame1
+        assert frame2.frame_id == first_id + 1
+
+    def test_predator_metrics_throttled(self):
+        """Predator metrics refresh every METRICS_STRIDE frames."""
+        from simulation_manager import METRICS_STRIDE
+        
+        manager = SimulationManager(PREDATOR_PARAMS, seed=42)
+        first = manager.get_frame_data().metrics.avg_distance_to_predator
+        assert first is not None
+        
+        manager.update()
+        assert manager.get_frame_data().metrics.avg_distance_to_predator == first
+        
+        manager.update_n(METRICS_STRIDE - 1)
+        assert manager.get_frame_data().metrics.avg_distance_to_predator != first
+
+    def test_obstacles_sent_only_when_changed(self, small_manager):
+        """Unchanged obstacles are omitted (None) from later frames."""
+        assert small_manager.get_frame_data().obstacles == []
+        small_manager.update()
+        assert small_manager.get_frame_data().obstacles is None
+        
+        small_manager.add_obstacle(100, 100, radius=30)
+        small_manager.update()
+        assert small_manager.get_frame_data().obstacles == [[100.0, 100.0, 30.0]]
+        small_manager.update()
+        assert small_manager.get_frame_data().obstacles is None
+        
+        small_manager.clear_obstacles()
+        small_manager.update()
+        assert small_manager.get_frame_data().obstacles == []
+
 
 class TestSimulationManagerReset:
     """Tests for simulation reset."""
 
-    def test_reset_resets_frame_id(self):
+    def test_reset_resets_frame_id(self, small_manager):
         """Reset sets frame ID to 0."""
-        manager = SimulationManager(seed=42)
-        manager.update()
-        manager.update()
-        assert manager.frame_id == 2
+        small_manager.update()
+        small_manager.update()
+        assert small_manager.frame_id == 2
         
-        manager.reset()
-        assert manager.frame_id == 0
+        small_manager.reset()
+        assert small_manager.frame_id == 0
 
     def test_reset_recreates_boids(self):
         """Reset creates new boid positions."""
@@ -167,14 +255,20 @@ class TestSimulationManagerReset:
 class TestSimulationManagerParams:
     """Tests for parameter updates."""
 
-    def test_update_params_basic(self):
+    def test_update_params_basic(self, small_manager):
         """Basic parameter update works."""
-        manager = SimulationManager()
-        manager.update_params({"visual_range": 80})
+        small_manager.update_params({"visual_range": 80})
         
-        params = manager.get_params()
+        params = small_manager.get_params()
         assert params.visual_range == 80
 
+    def test_update_params_pushed_to_flock(self, small_manager):
+        """In-place updates reach the running flock's params."""
+        small_manager.update_params({"visual_range": 80, "turn_factor": 0.5})
+        
+        assert small_manager._flock.params.visual_range == 80
+        assert small_manager._flock.params.turn_factor == 0.5
+
     def test_update_num_boids_recreates(self):
         """Changing num_boids recreates flock."""
         manager = SimulationManager()
@@ -183,18 +277,16 @@ class TestSimulationManagerParams:
         manager.update_params({"num_boids": 100})
         assert manager.num_boids == 100
 
-    def test_enable_predator(self):
+    def test_enable_predator(self, small_manager):
         """Enabling predator works."""
-        manager = SimulationManager()
-        assert manager.has_predator is False
+        assert small_manager.has_predator is False
         
-        manager.update_params({"predator_enabled": True})
-        assert manager.has_predator is True
+        small_manager.update_params({"predator_enabled": True})
+        assert small_manager.has_predator is True
 
     def test_disable_predator(self):
         """Disabling predator works."""
-        params = SimulationParams(predator_enabled=True)
-        manager = SimulationManager(params=params)
+        manager = SimulationManager(params=PREDATOR_PARAMS)
         assert manager.has_predator is True
         
         manager.update_params({"predator_enabled": False})
@@ -210,6 +302,16 @@ class TestSimulationManagerParams:
         assert 'predator_enabled' in d
         assert len(d) == 15
 
+    def test_get_params_dict_tracks_updates(self):
+        """Cached params dict reflects updates and is safe to mutate."""
+        manager = SimulationManager()
+        d = manager.get_params_dict()
+        d['visual_range'] = -1
+        assert manager.get_params_dict()['visual_range'] != -1
+        
+        manager.update_params({"visual_range": 80})
+        assert manager.get_params_dict()['visual_range'] == 80
+
     def test_invalid_params_ignored(self):
         """Invalid parameter updates are ignored."""
         manager = SimulationManager()
@@ -235,43 +337,47 @@ class TestSimulationManagerFrameData:
         assert isinstance(frame.boids, list)
         assert len(frame.boids) == 50
 
-    def test_boids_format(self):
+    def test_boids_format(self, small_manager):
         """Boids are [x, y, vx, vy] format."""
-        manager = SimulationManager(seed=42)
-        frame = manager.get_frame_data()
+        frame = small_manager.get_frame_data()
         
-        boid = frame.boids[0]
-        assert len(boid) == 4
-        assert all(isinstance(v, float) for v in boid)
+        boids = np.asarray(frame.boids)
+        assert boids.shape == (small_manager.num_boids, 4)
+        assert boids.dtype.kind == 'f'
 
-    def test_no_predator_when_disabled(self):
+    def test_packed_boids_match_lists(self):
+        """pack_boids sends the same rows as float32 bytes."""
+        listed = SimulationManager(seed=42).get_frame_data().boids
+        packed = SimulationManager(seed=42, pack_boids=True).get_frame_data().boids
+        
+        assert isinstance(packed, bytes)
+        rows = np.frombuffer(packed, dtype='<f4').reshape(-1, 4)
+        np.testing.assert_allclose(rows, np.array(listed), rtol=1e-6)
+
+    def test_no_predator_when_disabled(self, small_manager):
         """No predator data when disabled."""
-        manager = SimulationManager()
-        frame = manager.get_frame_data()
+        frame = small_manager.get_frame_data()
         
         assert frame.predator is None
 
     def test_predator_when_enabled(self):
         """Predator data present when enabled."""
-        params = SimulationParams(predator_enabled=True)
-        manager = SimulationManager(params=params, seed=42)
+        manager = SimulationManager(params=PREDATOR_PARAMS, seed=42)
         frame = manager.get_frame_data()
         
         assert frame.predator is not None
         assert len(frame.predator) == 4
 
-    def test_metrics_always_present(self):
+    def test_metrics_always_present(self, small_manager):
         """Metrics always present."""
-        manager = SimulationManager()
-        frame = manager.get_frame_data()
+        frame = small_manager.get_frame_data()
         
         assert frame.metrics is not None
         assert frame.metrics.fps > 0
 
     def test_metrics_with_predator(self):
         """Metrics include predator stats when predator active."""
-        params = SimulationParams(predator_enabled=True)
-        manager = SimulationManager(params=params, seed=42)
+        manager = SimulationManager(params=PREDATOR_PARAMS, seed=42)
         manager.update()  # Need at least one frame
         frame = manager.get_frame_data()
         
@@ -279,10 +385,9 @@ class TestSimulationManagerFrameData:
         assert frame.metrics.min_distance_to_predator is not None
         assert frame.metrics.flock_cohesion is not None
 
-    def test_metrics_without_predator(self):
+    def test_metrics_without_predator(self, small_manager):
         """Metrics don't include predator stats when predator inactive."""
-        manager = SimulationManager()
-        frame = manager.get_frame_data()
+        frame = small_manager.get_frame_data()
         
         assert frame.metrics.fps > 0
         assert frame.metrics.avg_distance_to_predator is None
@@ -291,10 +396,20 @@ class TestSimulationManagerFrameData:
 class TestSimulationManagerProperties:
     """Tests for manager properties."""
 
-    def test_fps_property(self):
+    def test_fps_property(self, default_manager):
         """FPS property returns reasonable value."""
-        manager = SimulationManager()
-        assert manager.fps > 0
+        assert default_manager.fps > 0
+
+    def test_fps_smoothed_after_updates(self, small_manager):
+        """FPS stays positive across updates and resets to target on reset."""
+        from config import TARGET_FPS
+        small_manager.start()
+        for _ in range(5):
+            small_manager.update()
+        assert small_manager.fps > 0
+
+        small_manager.reset()
+        assert small_manager.fps == TARGET_FPS
 
     def test_num_boids_property(self):
         """num_boids property matches param."""
@@ -304,106 +419,110 @@ class TestSimulationManagerProperties:
 
     def test_has_predator_property(self):
         """has_predator property matches state."""
-        manager = SimulationManager()
-        assert manager.has_predator is False
-        
-        params = SimulationParams(predator_enabled=True)
-        manager2 = SimulationManager(params=params)
-        assert manager2.has_predator is True
+        manager = SimulationManager(params=PREDATOR_PARAMS)
+        assert manager.has_predator is True
 
 
 class TestSimulationManagerObstacles:
     """Tests for SimulationManager obstacle methods."""
 
-    def test_add_obstacle(self):
+    @pytest.fixture(autouse=True)
+    def _clear_obstacles(self, obs_manager):
+        """Start and leave each test with no obstacles."""
+        obs_manager.clear_obstacles()
+        yield
+        obs_manager.clear_obstacles()
+
+    def test_add_obstacle(self, obs_manager):
         """Add obstacle returns obstacle data."""
-        manager = SimulationManager()
-        result = manager.add_obstacle(100, 200, radius=40)
+        result = obs_manager.add_obstacle(100, 200, radius=40)
         
         assert result['index'] == 0
         assert result['x'] == 100
         assert result['y'] == 200
         assert result['radius'] == 40
 
-    def test_add_multiple_obstacles(self):
+    def test_add_multiple_obstacles(self, obs_manager):
         """Add multiple obstacles."""
-        manager = SimulationManager()
-        obs1 = manager.add_obstacle(100, 100)
-        obs2 = manager.add_obstacle(200, 200)
+        obs1 = obs_manager.add_obstacle(100, 100)
+        obs2 = obs_manager.add_obstacle(200, 200)
         
         assert obs1['index'] == 0
         assert obs2['index'] == 1
-        assert manager.num_obstacles == 2
+        assert obs_manager.num_obstacles == 2
 
-    def test_remove_obstacle(self):
+    def test_remove_obstacle(self, obs_manager):
         """Remove obstacle by index."""
-        manager = SimulationManager()
-        manager.add_obstacle(100, 100)
-        manager.add_obstacle(200, 200)
+        obs_manager.add_obstacle(100, 100)
+        obs_manager.add_obstacle(200, 200)
         
-        result = manager.remove_obstacle(0)
+        result = obs_manager.remove_obstacle(0)
         
         assert result is True
-        assert manager.num_obstacles == 1
+        assert obs_manager.num_obstacles == 1
 
-    def test_remove_invalid_index(self):
+    def test_remove_invalid_index(self, obs_manager):
         """Remove with invalid index returns False."""
-        manager = SimulationManager()
-        manager.add_obstacle(100, 100)
+        obs_manager.add_obstacle(100, 100)
         
-        assert manager.remove_obstacle(5) is False
-        assert manager.num_obstacles == 1
+        assert obs_manager.remove_obstacle(5) is False
+        assert obs_manager.num_obstacles == 1
 
-    def test_clear_obstacles(self):
+    def test_clear_obstacles(self, obs_manager):
         """Clear all obstacles."""
-        manager = SimulationManager()
-        manager.add_obstacle(100, 100)
-        manager.add_obstacle(200, 200)
-        manager.add_obstacle(300, 300)
+        obs_manager.add_obstacle(100, 100)
+        obs_manager.add_obstacle(200, 200)
+        obs_manager.add_obstacle(300, 300)
         
-        count = manager.clear_obstacles()
+        count = obs_manager.clear_obstacles()
         
         assert count == 3
-        assert manager.num_obstacles == 0
+        assert obs_manager.num_obstacles == 0
 
-    def test_get_obstacles(self):
+    def test_get_obstacles(self, obs_manager):
         """Get obstacles returns list."""
-        manager = SimulationManager()
-        manager.add_obstacle(100, 100, radius=30)
-        manager.add_obstacle(200, 200, radius=40)
+        obs_manager.add_obstacle(100, 100, radius=30)
+        obs_manager.add_obstacle(200, 200, radius=40)
         
-        obstacles = manager.get_obstacles()
+        obstacles = obs_manager.get_obstacles()
         
         assert len(obstacles) == 2
         assert obstacles[0]['x'] == 100
         assert obstacles[1]['radius'] == 40
 
-    def test_frame_data_includes_obstacles(self):
+    def test_frame_data_includes_obstacles(self, obs_manager):
         """Frame data includes obstacles."""
-        manager = SimulationManager()
-        manager.add_obstacle(100, 100, radius=30)
-        manager.add_obstacle(200, 200, radius=40)
+        obs_manager.add_obstacle(100, 100, radius=30)
+        obs_manager.add_obstacle(200, 200, radius=40)
         
-        frame = manager.get_frame_data()
+        frame = obs_manager.get_frame_data()
         
         assert len(frame.obstacles) == 2
         assert frame.obstacles[0] == [100, 100, 30]
         assert frame.obstacles[1] == [200, 200, 40]
 
-    def test_frame_data_empty_obstacles(self):
+    def test_frame_data_many_obstacles(self, obs_manager):
+        """Frame data grows past the initial obstacle buffer capacity."""
+        for i in range(20):
+            obs_manager.add_obstacle(100 + i, 100, radius=30)
+
+        frame = obs_manager.get_frame_data()
+
+        assert len(frame.obstacles) == 20
+        assert frame.obstacles[19] == [119, 100, 30]
+
+    def test_frame_data_empty_obstacles(self, obs_manager):
         """Frame data has empty obstacles list when none."""
-        manager = SimulationManager()
-        frame = manager.get_frame_data()
+        frame = obs_manager.get_frame_data()
         
         assert frame.obstacles == []
 
-    def test_num_obstacles_property(self):
+    def test_num_obstacles_property(self, obs_manager):
         """num_obstacles property works."""
-        manager = SimulationManager()
-        assert manager.num_obstacles == 0
+        assert obs_manager.num_obstacles == 0
         
-        manager.add_obstacle(100, 100)
-        assert manager.num_obstacles == 1
+        obs_manager.add_obstacle(100, 100)
+        assert obs_manager.num_obstacles == 1
 
 
 if __name__ == "__main__":
@@ -2,6 +2,10 @@
 Tests for FastAPI WebSocket server.
 """
 
+import base64
+import json
+
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
@@ -13,12 +17,50 @@ from config import MessageType
 # Test Client Fixture
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create test client."""
+    """Create one test client per module; each test opens its own WebSocket."""
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def isolated_connections():
+    """Stop and drop any simulations a test leaves in connection_manager."""
+    snapshot = dict(connection_manager.active_connections)
+    yield
+    for websocket, manager in list(connection_manager.active_connections.items()):
+        if websocket not in snapshot:
+            manager.stop()
+    connection_manager.active_connections.clear()
+    connection_manager.active_connections.update(snapshot)
+
+
+def receive_until(ws, target_type, limit=10, match=None):
+    """
+    Read messages until one of target_type arrives and return it parsed.
+    
+    Frames are skipped with a substring check on the raw text, so only
+    candidate messages are JSON-decoded. The server sends compact JSON.
+    
+    Args:
+        ws: Open test WebSocket session
+        target_type: Message ``type`` to wait for
+        limit: Maximum number of messages to read
+        match: Optional predicate the decoded message must also satisfy
+    
+    Returns:
+        The decoded message dict
+    """
+    marker = f'"type":"{target_type}"'
+    for _ in range(limit):
+        raw = ws.receive_text()
+        if marker in raw:
+            data = json.loads(raw)
+            if match is None or match(data):
+                return data
+    pytest.fail(f"no {target_type!r} message within {limit} messages")
+
+
 # =============================================================================
 # REST Endpoint Tests
 # =============================================================================
@@ -73,8 +115,7 @@ class TestWebSocketConnection:
             websocket.receive_json()
             
             # Should receive frame
-            data = websocket.receive_json()
-            assert data["type"] == MessageType.FRAME
+            data = receive_until(websocket, MessageType.FRAME, limit=1)
             assert "frame_id" in data
             assert "boids" in data
 
@@ -98,13 +139,9 @@ class TestWebSocketMessages:
                 "params": {"num_boids": 75}
             })
             
-            # Should receive params_sync back
-            # May receive frame first, so check a few messages
-            for _ in range(5):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.PARAMS_SYNC:
-                    assert data["params"]["num_boids"] == 75
-                    break
+            # Should receive params_sync back (frames may come first)
+            data = receive_until(websocket, MessageType.PARAMS_SYNC)
+            assert data["params"]["num_boids"] == 75
 
     def test_reset(self, client):
         """Reset message works."""
@@ -116,11 +153,8 @@ class TestWebSocketMessages:
             websocket.send_json({"type": "reset"})
             
             # Should receive params_sync back
-            for _ in range(5):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.PARAMS_SYNC:
-                    assert "params" in data
-                    break
+            data = receive_until(websocket, MessageType.PARAMS_SYNC)
+            assert "params" in data
 
     def test_preset(self, client):
         """Preset message works."""
@@ -135,12 +169,9 @@ class TestWebSocketMessages:
             })
             
             # Should receive params_sync with preset values
-            for _ in range(5):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.PARAMS_SYNC:
-                    # tight_swarm has 100 boids
-                    assert data["params"]["num_boids"] == 100
-                    break
+            data = receive_until(websocket, MessageType.PARAMS_SYNC)
+            # tight_swarm has 100 boids
+            assert data["params"]["num_boids"] == 100
 
     def test_invalid_preset(self, client):
         """Invalid preset returns error."""
@@ -155,11 +186,8 @@ class TestWebSocketMessages:
             })
             
             # Should receive error
-            for _ in range(5):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.ERROR:
-                    assert "Invalid preset" in data["message"]
-                    break
+            data = receive_until(websocket, MessageType.ERROR)
+            assert "Invalid preset" in data["message"]
 
     def test_pause_resume(self, client):
         """Pause and resume messages work."""
@@ -168,9 +196,7 @@ class TestWebSocketMessages:
             websocket.receive_json()
             
             # Get initial frame
-            data1 = websocket.receive_json()
-            assert data1["type"] == MessageType.FRAME
-            frame1 = data1["frame_id"]
+            receive_until(websocket, MessageType.FRAME, limit=1)
             
             # Send pause
             websocket.send_json({"type": "pause"})
@@ -188,9 +214,11 @@ class TestWebSocketMessages:
             # Send resume
             websocket.send_json({"type": "resume"})
             
-            # Frame ID should start incrementing again
-            data = websocket.receive_json()
-            # May take a frame to resume
+            # Frame ID should start incrementing again (may take a frame)
+            receive_until(
+                websocket, MessageType.FRAME,
+                match=lambda d: d["frame_id"] > paused_frames[0],
+            )
 
     def test_unknown_message(self, client):
         """Unknown message type returns error."""
@@ -202,11 +230,8 @@ class TestWebSocketMessages:
             websocket.send_json({"type": "unknown_type"})
             
             # Should receive error
-            for _ in range(5):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.ERROR:
-                    assert "Unknown message type" in data["message"]
-                    break
+            data = receive_until(websocket, MessageType.ERROR)
+            assert "Unknown message type" in data["message"]
 
 
 # =============================================================================
@@ -236,9 +261,20 @@ class TestFrameData:
             
             # Get frame
             data = websocket.receive_json()
-            boid = data["boids"][0]
-            assert len(boid) == 4
-            assert all(isinstance(v, (int, float)) for v in boid)
+            boids = np.asarray(data["boids"])
+            assert boids.shape == (50, 4)
+            assert boids.dtype.kind == 'f'
+
+    def test_frame_packed_boids(self, client):
+        """?boids=f32 sends boids as base64 packed float32 rows."""
+        with client.websocket_connect("/ws?boids=f32") as websocket:
+            # Skip params_sync
+            websocket.receive_json()
+            
+            # Get frame
+            data = websocket.receive_json()
+            assert isinstance(data["boids"], str)
+            assert len(base64.b64decode(data["boids"])) == 50 * 4 * 4
 
     def test_frame_has_metrics(self, client):
         """Frame contains metrics."""
@@ -264,11 +300,10 @@ class TestFrameData:
             })
             
             # Find frame with predator
-            for _ in range(10):
-                data = websocket.receive_json()
-                if data["type"] == MessageType.FRAME and data.get("predator"):
-                    assert len(data["predator"]) == 4
-                    break
+            data = receive_until(
+                websocket, MessageType.FRAME, match=lambda d: d.get("predator")
+            )
+            assert len(data["predator"]) == 4
 
 
 # =============================================================================
@@ -293,14 +328,11 @@ class TestObstacleMessages:
             })
             
             # Find response
-            for _ in range(10):
-                data = websocket.receive_json()
-                if data["type"] == "obstacle_added":
-                    assert data["x"] == 200
-                    assert data["y"] == 300
-                    assert data["radius"] == 40
-                    assert data["index"] == 0
-                    break
+            data = receive_until(websocket, "obstacle_added")
+            assert data["x"] == 200
+            assert data["y"] == 300
+            assert data["radius"] == 40
+            assert data["index"] == 0
 
     def test_remove_obstacle(self, client):
         """Remove obstacle message works."""
@@ -312,21 +344,15 @@ class TestObstacleMessages:
             websocket.send_json({"type": "add_obstacle", "x": 100, "y": 100})
             
             # Wait for add response
-            for _ in range(10):
-                data = websocket.receive_json()
-                if data["type"] == "obstacle_added":
-                    break
+            receive_until(websocket, "obstacle_added")
             
             # Remove it
             websocket.send_json({"type": "remove_obstacle", "index": 0})
             
             # Find remove response
-            for _ in range(10):
-                data = websocket.receive_json()
-                if data["type"] == "obstacle_removed":
-                    assert data["success"] is True
-                    assert data["index"] == 0
-                    break
+            data = receive_until(websocket, "obstacle_removed")
+            assert data["success"] is True
+            assert data["index"] == 0
 
     def test_clear_obstacles(self, client):
         """Clear obstacles message works."""
@@ -352,11 +378,8 @@ class TestObstacleMessages:
             websocket.send_json({"type": "clear_obstacles"})
             
             # Find clear response
-            for _ in range(10):
-                data = websocket.receive_json()
-                if data["type"] == "obstacles_cleared":
-                    assert data["count"] == 3
-                    break
+            data = receive_until(websocket, "obstacles_cleared")
+            assert data["count"] == 3
 
     def test_frame_includes_obstacles(self, client):
         """Frame data includes obstacles after adding."""
@@ -10,7 +10,8 @@
 import { useState, useRef, useCallback } from 'react';
 import './App.css';
 
-const WS_URL = 'ws://localhost:8000/ws';
+// boids=f32: frame boids arrive as base64 packed float32 rows
+const WS_URL = 'ws://localhost:8000/ws?boids=f32';
 
 interface PredatorData {
   x: number;
@@ -35,6 +36,17 @@ interface FrameData {
   };
 }
 
+/** Unpack base64 float32 boid rows into [x, y, vx, vy, ...] arrays. */
+const decodeBoids = (packed: string, stride: number): number[][] => {
+  const bytes = Uint8Array.from(atob(packed), (c) => c.charCodeAt(0));
+  const flat = new Float32Array(bytes.buffer);
+  const rows: number[][] = [];
+  for (let i = 0; i < flat.length; i += stride) {
+    rows.push(Array.from(flat.subarray(i, i + stride)));
+  }
+  return rows;
+};
+
 interface Params {
   num_boids: number;
   visual_range: number;
@@ -112,6 +124,7 @@ function App() {
   const [obstacleRadius, setObstacleRadius] = useState(30);
   const [obstacleCount, setObstacleCount] = useState(0);
   const wsRef = useRef<WebSocket | null>(null);
+  const obstaclesRef = useRef<number[][]>([]);
   const canvasRef = useRef<HTMLCanvasElement>(null);
 
   const sendMessage = useCallback((msg: object) => {
@@ -123,6 +136,7 @@ function App() {
   const connect = () => {
     if (wsRef.current?.readyState === WebSocket.OPEN) return;
     trailsMap.clear();
+    obstaclesRef.current = [];
 
     setStatus('connecting');
     const ws = new WebSocket(WS_URL);
@@ -137,6 +151,15 @@ function App() {
     ws.onmessage = (e) => {
       const data = JSON.parse(e.data);
       if (data.type === 'frame') {
+        if (typeof data.boids === 'string') {
+          data.boids = decodeBoids(data.boids, data.mode === '3d' ? 6 : 4);
+        }
+        // Server sends obstacles only when they change; reuse the last list otherwise
+        if (data.obstacles == null) {
+          data.obstacles = obstaclesRef.current;
+        } else {
+          obstaclesRef.current = data.obstacles;
+        }
         setFrameData(data);
         setObstacleCount(data.obstacles?.length || 0);
         drawFrame(data);